@@ -49,6 +49,8 @@ class HoymilesSmilesHealthBinarySensor(
         """Initialize the binary sensor."""
         super().__init__(coordinator)
         self._attr_unique_id = f"{entry.entry_id}_healthy"
+        # Kept as before rather than coordinator.device_info: switching would
+        # change the device name and sw_version shown for existing installs
         self._attr_device_info = {
             "identifiers": {(DOMAIN, entry.entry_id)},
             "name": "Hoymiles S-Miles Bridge",
@@ -58,33 +60,6 @@ class HoymilesSmilesHealthBinarySensor(
         }
         self._last_availability = None  # Track availability changes
 
-    async def async_added_to_hass(self) -> None:
-        """Handle entity added to hass."""
-        await super().async_added_to_hass()
-        
-        # Schedule initial state write after entity is fully registered
-        # Add a small delay to ensure recorder is ready
-        async def write_initial_state():
-            """Write initial state after recorder is ready."""
-            import asyncio
-            # Wait a moment for recorder to fully register the entity
-            await asyncio.sleep(0.5)
-            
-            _LOGGER.info(
-                "[Initial State] Writing initial state for Hoymiles S-Miles Bridge sensor: %s (available=%s)",
-                "on" if self.is_on else "off",
-                self.available
-            )
-            self.async_write_ha_state()
-            
-            # Force another write after 1 second to be absolutely sure
-            await asyncio.sleep(1)
-            _LOGGER.debug("[Initial State] Writing second state to ensure history capture")
-            self.async_write_ha_state()
-        
-        # Schedule for execution
-        self.hass.async_create_task(write_initial_state())
-
     @property
     def is_on(self) -> bool:
         """Return true if the binary sensor is on (healthy)."""
@@ -106,7 +81,7 @@ class HoymilesSmilesHealthBinarySensor(
         is_available = self.coordinator.last_update_success and self.coordinator.is_available()
         
         # Log availability changes for debugging
-        if hasattr(self, '_last_availability') and self._last_availability != is_available:
+        if self._last_availability != is_available:
             _LOGGER.info(
                 "[Availability Change] Hoymiles S-Miles Bridge sensor: %s → %s (last_update_success=%s, coordinator_available=%s)",
                 "available" if self._last_availability else "unavailable",
@@ -1,5 +1,7 @@
 """Constants for the Hoymiles S-Miles integration."""
+from dataclasses import dataclass
 from datetime import timedelta
+from types import MappingProxyType
 from typing import Final
 
 DOMAIN: Final = "hoymiles_smiles"
@@ -23,253 +25,236 @@ ENDPOINT_READY: Final = "/ready"
 ENDPOINT_STATS: Final = "/stats"
 ENDPOINT_METRICS: Final = "/metrics"
 ENDPOINT_INVERTERS: Final = "/api/inverters"
+ENDPOINT_BUNDLE: Final = "/bundle"
+
+
+@dataclass(frozen=True, slots=True)
+class SensorType:
+    """Static description of a sensor type."""
+
+    name: str
+    icon: str
+    unit: str | None = None
+    device_class: str | None = None
+    state_class: str | None = None
+    entity_category: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class BinarySensorType:
+    """Static description of a binary sensor type."""
+
+    name: str
+    icon: str
+    icon_off: str
+    device_class: str | None = None
+    entity_category: str | None = None
+
 
 # Sensor types
-SENSOR_TYPES: Final = {
-    "uptime": {
-        "name": "Uptime",
-        "icon": "mdi:clock-outline",
-        "unit": "s",
-        "device_class": "duration",
-        "state_class": "total_increasing",
-        "entity_category": None,
-    },
-    "dtu_query_count": {
-        "name": "DTU Query Count",
-        "icon": "mdi:counter",
-        "unit": "queries",
-        "device_class": None,
-        "state_class": "total_increasing",
-        "entity_category": None,
-    },
-    "dtu_error_count": {
-        "name": "DTU Error Count",
-        "icon": "mdi:alert-circle",
-        "unit": "errors",
-        "device_class": None,
-        "state_class": "total_increasing",
-        "entity_category": None,
-    },
-    "dtu_last_query": {
-        "name": "DTU Last Query",
-        "icon": "mdi:clock-check-outline",
-        "unit": "s",
-        "device_class": "duration",
-        "state_class": None,
-        "entity_category": None,
-    },
-    "database_size": {
-        "name": "Database Size",
-        "icon": "mdi:database",
-        "unit": "MB",
-        "device_class": None,
-        "state_class": "measurement",
-        "entity_category": "diagnostic",
-    },
-    "cached_records": {
-        "name": "Cached Records",
-        "icon": "mdi:database-check",
-        "unit": "records",
-        "device_class": None,
-        "state_class": "measurement",
-        "entity_category": "diagnostic",
-    },
-}
+SENSOR_TYPES: Final = MappingProxyType({
+    "uptime": SensorType(
+        name="Uptime",
+        icon="mdi:clock-outline",
+        unit="s",
+        device_class="duration",
+        state_class="total_increasing",
+    ),
+    "dtu_query_count": SensorType(
+        name="DTU Query Count",
+        icon="mdi:counter",
+        unit="queries",
+        state_class="total_increasing",
+    ),
+    "dtu_error_count": SensorType(
+        name="DTU Error Count",
+        icon="mdi:alert-circle",
+        unit="errors",
+        state_class="total_increasing",
+    ),
+    "dtu_last_query": SensorType(
+        name="DTU Last Query",
+        icon="mdi:clock-check-outline",
+        unit="s",
+        device_class="duration",
+    ),
+    "database_size": SensorType(
+        name="Database Size",
+        icon="mdi:database",
+        unit="MB",
+        state_class="measurement",
+        entity_category="diagnostic",
+    ),
+    "cached_records": SensorType(
+        name="Cached Records",
+        icon="mdi:database-check",
+        unit="records",
+        state_class="measurement",
+        entity_category="diagnostic",
+    ),
+})
 
 # Inverter-level sensor types (attached to inverter device)
-INVERTER_SENSOR_TYPES: Final = {
-    "grid_voltage": {
-        "name": "Grid Voltage",
-        "icon": "mdi:transmission-tower",
-        "unit": "V",
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "entity_category": None,
-    },
-    "grid_frequency": {
-        "name": "Grid Frequency",
-        "icon": "mdi:sine-wave",
-        "unit": "Hz",
-        "device_class": "frequency",
-        "state_class": "measurement",
-        "entity_category": None,
-    },
-    "temperature": {
-        "name": "Temperature",
-        "icon": "mdi:thermometer",
-        "unit": "°C",
-        "device_class": "temperature",
-        "state_class": "measurement",
-        "entity_category": None,
-    },
-    "operating_status": {
-        "name": "Operating Status",
-        "icon": "mdi:information-outline",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "entity_category": "diagnostic",
-    },
-    "link_status": {
-        "name": "Link Status",
-        "icon": "mdi:link-variant",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "entity_category": "diagnostic",
-    },
-    "alarm_code": {
-        "name": "Alarm Code",
-        "icon": "mdi:alert-circle",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "entity_category": "diagnostic",
-    },
-    "alarm_count": {
-        "name": "Alarm Count",
-        "icon": "mdi:counter",
-        "unit": None,
-        "device_class": None,
-        "state_class": "total_increasing",
-        "entity_category": "diagnostic",
-    },
-}
+INVERTER_SENSOR_TYPES: Final = MappingProxyType({
+    "grid_voltage": SensorType(
+        name="Grid Voltage",
+        icon="mdi:transmission-tower",
+        unit="V",
+        device_class="voltage",
+        state_class="measurement",
+    ),
+    "grid_frequency": SensorType(
+        name="Grid Frequency",
+        icon="mdi:sine-wave",
+        unit="Hz",
+        device_class="frequency",
+        state_class="measurement",
+    ),
+    "temperature": SensorType(
+        name="Temperature",
+        icon="mdi:thermometer",
+        unit="°C",
+        device_class="temperature",
+        state_class="measurement",
+    ),
+    "operating_status": SensorType(
+        name="Operating Status",
+        icon="mdi:information-outline",
+        entity_category="diagnostic",
+    ),
+    "link_status": SensorType(
+        name="Link Status",
+        icon="mdi:link-variant",
+        entity_category="diagnostic",
+    ),
+    "alarm_code": SensorType(
+        name="Alarm Code",
+        icon="mdi:alert-circle",
+        entity_category="diagnostic",
+    ),
+    "alarm_count": SensorType(
+        name="Alarm Count",
+        icon="mdi:counter",
+        state_class="total_increasing",
+        entity_category="diagnostic",
+    ),
+})
 
 # DTU-level sensor types (attached to DTU device)
-DTU_SENSOR_TYPES: Final = {
-    "inverter_count": {
-        "name": "Inverter Count",
-        "icon": "mdi:counter",
-        "unit": "inverters",
-        "device_class": None,
-        "state_class": "measurement",
-        "entity_category": None,
-    },
-    "last_query_time": {
-        "name": "Last Query Time",
-        "icon": "mdi:clock-check",
-        "unit": None,
-        "device_class": "timestamp",
-        "state_class": None,
-        "entity_category": "diagnostic",
-    },
-    "query_count": {
-        "name": "Query Count",
-        "icon": "mdi:counter",
-        "unit": "queries",
-        "device_class": None,
-        "state_class": "total_increasing",
-        "entity_category": "diagnostic",
-    },
-    "error_count": {
-        "name": "Error Count",
-        "icon": "mdi:alert-circle",
-        "unit": "errors",
-        "device_class": None,
-        "state_class": "total_increasing",
-        "entity_category": "diagnostic",
-    },
-    "communication_status": {
-        "name": "Communication Status",
-        "icon": "mdi:network",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "entity_category": "diagnostic",
-    },
-    "total_power": {
-        "name": "Total Power",
-        "icon": "mdi:lightning-bolt",
-        "unit": "W",
-        "device_class": "power",
-        "state_class": "measurement",
-        "entity_category": None,
-    },
-}
+DTU_SENSOR_TYPES: Final = MappingProxyType({
+    "inverter_count": SensorType(
+        name="Inverter Count",
+        icon="mdi:counter",
+        unit="inverters",
+        state_class="measurement",
+    ),
+    "last_query_time": SensorType(
+        name="Last Query Time",
+        icon="mdi:clock-check",
+        device_class="timestamp",
+        entity_category="diagnostic",
+    ),
+    "query_count": SensorType(
+        name="Query Count",
+        icon="mdi:counter",
+        unit="queries",
+        state_class="total_increasing",
+        entity_category="diagnostic",
+    ),
+    "error_count": SensorType(
+        name="Error Count",
+        icon="mdi:alert-circle",
+        unit="errors",
+        state_class="total_increasing",
+        entity_category="diagnostic",
+    ),
+    "communication_status": SensorType(
+        name="Communication Status",
+        icon="mdi:network",
+        entity_category="diagnostic",
+    ),
+    "total_power": SensorType(
+        name="Total Power",
+        icon="mdi:lightning-bolt",
+        unit="W",
+        device_class="power",
+        state_class="measurement",
+    ),
+})
 
 # Aggregate sensors at inverter level (sum of all ports)
-INVERTER_AGGREGATE_SENSORS: Final = {
-    "total_power": {
-        "name": "Total Power",
-        "icon": "mdi:lightning-bolt",
-        "unit": "W",
-        "device_class": "power",
-        "state_class": "measurement",
-        "entity_category": None,
-    },
-    "total_today_production": {
-        "name": "Total Today Production",
-        "icon": "mdi:solar-power",
-        "unit": "Wh",
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "entity_category": None,
-    },
-    "total_lifetime_production": {
-        "name": "Total Lifetime Production",
-        "icon": "mdi:solar-power",
-        "unit": "kWh",
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "entity_category": None,
-    },
-}
+INVERTER_AGGREGATE_SENSORS: Final = MappingProxyType({
+    "total_power": SensorType(
+        name="Total Power",
+        icon="mdi:lightning-bolt",
+        unit="W",
+        device_class="power",
+        state_class="measurement",
+    ),
+    "total_today_production": SensorType(
+        name="Total Today Production",
+        icon="mdi:solar-power",
+        unit="Wh",
+        device_class="energy",
+        state_class="total_increasing",
+    ),
+    "total_lifetime_production": SensorType(
+        name="Total Lifetime Production",
+        icon="mdi:solar-power",
+        unit="kWh",
+        device_class="energy",
+        state_class="total_increasing",
+    ),
+})
 
 # Port-level sensor types (attached to port device)
-PORT_SENSOR_TYPES: Final = {
-    "pv_voltage": {
-        "name": "PV Voltage",
-        "icon": "mdi:lightning-bolt",
-        "unit": "V",
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "entity_category": None,
-    },
-    "pv_current": {
-        "name": "PV Current",
-        "icon": "mdi:current-dc",
-        "unit": "A",
-        "device_class": "current",
-        "state_class": "measurement",
-        "entity_category": None,
-    },
-    "pv_power": {
-        "name": "PV Power",
-        "icon": "mdi:solar-power",
-        "unit": "W",
-        "device_class": "power",
-        "state_class": "measurement",
-        "entity_category": None,
-    },
-    "today_production": {
-        "name": "Today Production",
-        "icon": "mdi:solar-power",
-        "unit": "Wh",
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "entity_category": None,
-    },
-    "total_production": {
-        "name": "Total Production",
-        "icon": "mdi:solar-power",
-        "unit": "kWh",
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "entity_category": None,
-    },
-}
+PORT_SENSOR_TYPES: Final = MappingProxyType({
+    "pv_voltage": SensorType(
+        name="PV Voltage",
+        icon="mdi:lightning-bolt",
+        unit="V",
+        device_class="voltage",
+        state_class="measurement",
+    ),
+    "pv_current": SensorType(
+        name="PV Current",
+        icon="mdi:current-dc",
+        unit="A",
+        device_class="current",
+        state_class="measurement",
+    ),
+    "pv_power": SensorType(
+        name="PV Power",
+        icon="mdi:solar-power",
+        unit="W",
+        device_class="power",
+        state_class="measurement",
+    ),
+    "today_production": SensorType(
+        name="Today Production",
+        icon="mdi:solar-power",
+        unit="Wh",
+        device_class="energy",
+        state_class="total_increasing",
+    ),
+    "total_production": SensorType(
+        name="Total Production",
+        icon="mdi:solar-power",
+        unit="kWh",
+        device_class="energy",
+        state_class="total_increasing",
+    ),
+})
 
 # Binary sensor types
-BINARY_SENSOR_TYPES: Final = {
-    "healthy": {
-        "name": "Application Healthy",
-        "icon": "mdi:check-circle",
-        "icon_off": "mdi:alert-circle",
-        "device_class": "connectivity",
-        "entity_category": None,
-    },
-}
+BINARY_SENSOR_TYPES: Final = MappingProxyType({
+    "healthy": BinarySensorType(
+        name="Application Healthy",
+        icon="mdi:check-circle",
+        icon_off="mdi:alert-circle",
+        device_class="connectivity",
+    ),
+})
 
 # Attributes
 ATTR_START_TIME: Final = "start_time"
@@ -279,7 +264,7 @@ ATTR_DTU_LAST_ERROR_TIME: Final = "dtu_last_error_time"
 ATTR_CIRCUIT_BREAKER_STATE: Final = "circuit_breaker_state"
 
 # Status code mappings
-OPERATING_STATUS_MAP: Final = {
+OPERATING_STATUS_MAP: Final = MappingProxyType({
     0: "Normal",
     1: "Starting",
     2: "Standby",
@@ -288,18 +273,18 @@ OPERATING_STATUS_MAP: Final = {
     5: "Permanent Fault",
     6: "Communication Interrupted",
     7: "Unknown",
-}
+})
 
-LINK_STATUS_MAP: Final = {
+LINK_STATUS_MAP: Final = MappingProxyType({
     0: "Disconnected",
     1: "Connected",
     2: "Poor Signal",
     3: "Good Signal",
     4: "Excellent Signal",
-}
+})
 
 # Common Hoymiles alarm codes
-ALARM_CODE_MAP: Final = {
+ALARM_CODE_MAP: Final = MappingProxyType({
     0: "No Alarm",
     1: "Inverter Over Temperature",
     2: "DC Over Voltage",
@@ -324,5 +309,5 @@ ALARM_CODE_MAP: Final = {
     144: "AFCI Self Check Error",
     201: "Waiting for Grid",
     205: "Grid Abnormal",
-}
+})
 
@@ -3,19 +3,73 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
+import secrets
+import time
+from collections.abc import Awaitable, Callable
 from datetime import timedelta
 from typing import Any
 
 import aiohttp
 import async_timeout
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, ENDPOINT_HEALTH, ENDPOINT_STATS, ENDPOINT_INVERTERS
+from .const import DOMAIN, ENDPOINT_BUNDLE, ENDPOINT_HEALTH, ENDPOINT_STATS, ENDPOINT_INVERTERS
 
 _LOGGER = logging.getLogger(__name__)
 
+# Per-request budget; the whole update is bounded separately
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# Retry backoff for endpoint fetches (seconds)
+RETRY_BACKOFF_BASE = 0.1
+RETRY_BACKOFF_MAX = 30.0
+RETRY_JITTER = 0.5
+
+# 1 / 2**20, exact in binary floating point
+BYTES_TO_MB = 9.5367431640625e-07
+
+
+async def _retry(
+    fn: Callable[..., Awaitable[Any]],
+    *args: Any,
+    retries: int = 3,
+    base: float = RETRY_BACKOFF_BASE,
+    cap: float = RETRY_BACKOFF_MAX,
+    jitter: float = RETRY_JITTER,
+    recoverable: tuple[type[BaseException], ...] = (aiohttp.ClientError, asyncio.TimeoutError),
+) -> Any:
+    """Await fn(*args), retrying recoverable errors with exponential backoff.
+
+    Backoff is jittered so coordinators do not retry in lockstep against a
+    recovering bridge. HTTP client errors (4xx) are never retried.
+    """
+    for attempt in range(retries):
+        try:
+            return await fn(*args)
+        except recoverable as err:
+            if isinstance(err, aiohttp.ClientResponseError) and err.status < 500:
+                raise
+            if attempt == retries - 1:
+                _LOGGER.warning("All %d retries failed for %s: %s", retries, args[-1], err)
+                raise
+            # ~0.1s, 0.2s, 0.4s ... plus up to 50% jitter
+            wait_time = min(cap, base * (2 ** attempt) * (1 + random.random() * jitter))
+            _LOGGER.debug(
+                "Retry %d/%d for %s after %s, waiting %.2fs",
+                attempt + 1, retries, args[-1], err, wait_time
+            )
+            await asyncio.sleep(wait_time)
+
 
 class HoymilesSmilesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator to manage data fetching from Hoymiles S-Miles API."""
@@ -32,15 +86,34 @@ class HoymilesSmilesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.host = host
         self.port = port
         self.base_url = f"http://{host}:{port}"
+        # Full URLs of the endpoints fetched on every poll
+        self._urls = {
+            endpoint: f"{self.base_url}{endpoint}"
+            for endpoint in (ENDPOINT_BUNDLE, ENDPOINT_HEALTH, ENDPOINT_STATS, ENDPOINT_INVERTERS)
+        }
         self.entry_id = entry_id
-        self._session: aiohttp.ClientSession | None = None
         self._consecutive_failures = 0
         self._last_push_update: float = 0
         self._push_data: dict[str, Any] | None = None
         self._ws: Any = None  # WebSocket connection from bridge
+        # System sensor values derived from self.data (see get_sensor_snapshot)
+        self._snapshot: dict[str, Any] = {}
+        self._snapshot_source: dict[str, Any] | None = None
+        # Inverters in self.data indexed by serial number (see get_inverter_data)
+        self._inverters_by_serial: dict[str, dict[str, Any]] = {}
+        self._inverters_source: dict[str, Any] | None = None
+        # Cleared once the bridge answers 404 for the combined endpoint
+        self._bundle_supported = True
+        # Bridge device, shared by every system-level entity of this entry
+        self.device_info: DeviceInfo = {
+            "identifiers": {(DOMAIN, entry_id)},
+            "name": "Hoymiles S-Miles",
+            "manufacturer": "Hoymiles",
+            "model": "S-Miles Bridge",
+            "sw_version": "2.0.0",
+        }
         
         # Generate authentication token for WebSocket
-        import secrets
         self._ws_token = secrets.token_urlsafe(32)
         
         super().__init__(
@@ -50,28 +123,16 @@ class HoymilesSmilesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             update_interval=timedelta(seconds=scan_interval),
         )
 
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
-        if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=30, connect=10, sock_read=15)
-            self._session = aiohttp.ClientSession(
-                timeout=timeout,
-                connector=aiohttp.TCPConnector(
-                    limit=10,
-                    ttl_dns_cache=300,
-                    force_close=False,
-                ),
-            )
-            _LOGGER.debug("Created new aiohttp session for %s:%s", self.host, self.port)
-        return self._session
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get Home Assistant's shared aiohttp session."""
+        return async_get_clientsession(self.hass)
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API (used as fallback when push updates are stale)."""
-        import time
-        start_time = time.time()
+        start_time = time.monotonic()
         
         # Check if we have recent push data (less than 2x the update interval)
-        time_since_push = time.time() - self._last_push_update
+        time_since_push = time.monotonic() - self._last_push_update
         max_push_age = self.update_interval.total_seconds() * 2
         
         if self._push_data and time_since_push < max_push_age:
@@ -94,33 +155,23 @@ class HoymilesSmilesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 "WebSocket push may not be configured or connected."
             )
         
-        _LOGGER.debug(
-            "[API Call Start] Fetching data from %s:%s (session_active=%s, consecutive_failures=%d)",
-            self.host, self.port,
-            self._session is not None and not self._session.closed,
-            self._consecutive_failures
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "[API Call Start] Fetching data from %s:%s (consecutive_failures=%d)",
+                self.host, self.port,
+                self._consecutive_failures
+            )
         
         try:
-            session = await self._get_session()
+            session = self._get_session()
             
             # Use a longer timeout - 20 seconds total
             async with async_timeout.timeout(20):
-                # Fetch health data with retry
-                _LOGGER.debug("[API Call] Fetching %s from %s:%s", ENDPOINT_HEALTH, self.host, self.port)
-                health_data = await self._fetch_endpoint_with_retry(session, ENDPOINT_HEALTH)
+                health_data, stats_data, inverters_data = await self._fetch_all(session)
                 _LOGGER.debug("[API Call] Received health data: healthy=%s, uptime=%s",
                              health_data.get("healthy"), health_data.get("uptime_seconds"))
-                
-                # Fetch stats data with retry
-                _LOGGER.debug("[API Call] Fetching %s from %s:%s", ENDPOINT_STATS, self.host, self.port)
-                stats_data = await self._fetch_endpoint_with_retry(session, ENDPOINT_STATS)
-                _LOGGER.debug("[API Call] Received stats data: records=%s", 
+                _LOGGER.debug("[API Call] Received stats data: records=%s",
                              stats_data.get("total_records"))
-                
-                # Fetch inverters data with retry
-                _LOGGER.debug("[API Call] Fetching %s from %s:%s", ENDPOINT_INVERTERS, self.host, self.port)
-                inverters_data = await self._fetch_endpoint_with_retry(session, ENDPOINT_INVERTERS)
                 _LOGGER.debug("[API Call] Received inverters data: count=%s", len(inverters_data) if inverters_data else 0)
                 
                 # Reset failure counter on success
@@ -131,7 +182,7 @@ class HoymilesSmilesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     )
                 self._consecutive_failures = 0
                 
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
                 _LOGGER.debug(
                     "[API Call Complete] Success in %.2fs from %s:%s",
                     elapsed, self.host, self.port
@@ -145,46 +196,24 @@ class HoymilesSmilesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     "available": True,
                 }
         except asyncio.TimeoutError as err:
-            import time
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             self._consecutive_failures += 1
             _LOGGER.warning(
                 "[API Call Failed] Timeout after %.2fs from %s:%s (failure %d): %s",
                 elapsed, self.host, self.port, self._consecutive_failures, err
             )
-            _LOGGER.debug(
-                "[API Call Failed] Session state: active=%s, closed=%s",
-                self._session is not None,
-                self._session.closed if self._session else "N/A"
-            )
-            # Close session on timeout to force fresh connection next time
-            if self._session and not self._session.closed:
-                _LOGGER.debug("[Session] Closing session due to timeout")
-                await self._session.close()
-                self._session = None
             raise UpdateFailed(f"Timeout communicating with API: {err}") from err
         except aiohttp.ClientError as err:
-            import time
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             self._consecutive_failures += 1
             _LOGGER.warning(
                 "[API Call Failed] Client error after %.2fs from %s:%s (failure %d): %s",
                 elapsed, self.host, self.port, self._consecutive_failures, err
             )
-            _LOGGER.debug(
-                "[API Call Failed] Error type: %s, Session: %s",
-                type(err).__name__,
-                "active" if (self._session and not self._session.closed) else "closed/none"
-            )
-            # Close session on client error
-            if self._session and not self._session.closed:
-                _LOGGER.debug("[Session] Closing session due to client error")
-                await self._session.close()
-                self._session = None
+            _LOGGER.debug("[API Call Failed] Error type: %s", type(err).__name__)
             raise UpdateFailed(f"Error communicating with API: {err}") from err
         except Exception as err:
-            import time
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             self._consecutive_failures += 1
             _LOGGER.error(
                 "[API Call Failed] Unexpected error after %.2fs from %s:%s (failure %d): %s",
@@ -193,47 +222,53 @@ class HoymilesSmilesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
             raise UpdateFailed(f"Unexpected error: {err}") from err
 
-    async def _fetch_endpoint_with_retry(
-        self, session: aiohttp.ClientSession, endpoint: str, max_retries: int = 2
-    ) -> dict[str, Any]:
-        """Fetch data from a specific endpoint with retry logic."""
-        last_error = None
-        
-        for attempt in range(max_retries):
+    async def _fetch_all(
+        self, session: aiohttp.ClientSession
+    ) -> tuple[dict[str, Any], dict[str, Any], list[dict[str, Any]]]:
+        """Fetch health, stats and inverters data.
+
+        Uses the bridge's combined endpoint (one round trip) when available and
+        falls back to fetching the separate endpoints concurrently on bridges
+        that do not provide it.
+        """
+        if self._bundle_supported:
+            _LOGGER.debug("[API Call] Fetching %s from %s:%s", ENDPOINT_BUNDLE, self.host, self.port)
             try:
-                return await self._fetch_endpoint(session, endpoint)
-            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
-                last_error = err
-                if attempt < max_retries - 1:
-                    wait_time = 0.5 * (attempt + 1)  # 0.5s, 1s
-                    _LOGGER.debug(
-                        "Retry %d/%d for %s after %s, waiting %.1fs",
-                        attempt + 1, max_retries, endpoint, err, wait_time
-                    )
-                    await asyncio.sleep(wait_time)
-                else:
-                    _LOGGER.warning(
-                        "All %d retries failed for %s: %s",
-                        max_retries, endpoint, err
-                    )
-        
-        # All retries failed
-        raise last_error
+                bundle = await _retry(self._fetch_endpoint, session, ENDPOINT_BUNDLE)
+            except aiohttp.ClientResponseError as err:
+                if err.status != 404:
+                    raise
+                _LOGGER.info(
+                    "Bridge at %s:%s does not provide %s, using separate endpoints",
+                    self.host, self.port, ENDPOINT_BUNDLE
+                )
+                self._bundle_supported = False
+            else:
+                return bundle.get("health", {}), bundle.get("stats", {}), bundle.get("inverters", [])
+
+        _LOGGER.debug(
+            "[API Call] Fetching %s, %s, %s from %s:%s",
+            ENDPOINT_HEALTH, ENDPOINT_STATS, ENDPOINT_INVERTERS, self.host, self.port
+        )
+        return await asyncio.gather(
+            _retry(self._fetch_endpoint, session, ENDPOINT_HEALTH),
+            _retry(self._fetch_endpoint, session, ENDPOINT_STATS),
+            _retry(self._fetch_endpoint, session, ENDPOINT_INVERTERS),
+        )
 
     async def _fetch_endpoint(
         self, session: aiohttp.ClientSession, endpoint: str
     ) -> dict[str, Any]:
         """Fetch data from a specific endpoint."""
-        import time
-        url = f"{self.base_url}{endpoint}"
-        fetch_start = time.time()
+        url = self._urls.get(endpoint) or f"{self.base_url}{endpoint}"
+        fetch_start = time.monotonic()
         
         _LOGGER.debug("[HTTP] GET %s", url)
         
         try:
-            async with session.get(url) as response:
+            async with session.get(url, timeout=REQUEST_TIMEOUT) as response:
                 status = response.status
-                fetch_time = time.time() - fetch_start
+                fetch_time = time.monotonic() - fetch_start
                 
                 _LOGGER.debug(
                     "[HTTP] Response %d from %s in %.3fs",
@@ -241,15 +276,21 @@ class HoymilesSmilesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 )
                 
                 response.raise_for_status()
-                data = await response.json()
+                data = _json_loads(await response.read())
                 
-                _LOGGER.debug(
-                    "[HTTP] Successfully parsed JSON from %s (%d bytes)",
-                    endpoint, len(str(data))
-                )
+                # len(str(data)) re-serializes the whole payload; only pay for it when debugging
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "[HTTP] Successfully parsed JSON from %s (%d bytes)",
+                        endpoint, len(str(data))
+                    )
                 
                 return data
         except aiohttp.ClientResponseError as err:
+            if endpoint == ENDPOINT_BUNDLE and err.status == 404:
+                # Expected from older bridges; _fetch_all falls back to separate endpoints
+                _LOGGER.debug("[HTTP] %s not found on bridge", endpoint)
+                raise
             _LOGGER.error(
                 "[HTTP] Response error %d from %s: %s",
                 err.status, endpoint, err.message
@@ -284,6 +325,42 @@ class HoymilesSmilesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return health["dtus"][dtu_name]
         return None
 
+    def get_sensor_snapshot(self) -> dict[str, Any]:
+        """Get system sensor values derived from the current coordinator data.
+
+        The snapshot is rebuilt only when the coordinator data changes, so the
+        system sensors do not walk the health/stats dicts on every state read.
+        """
+        if self._snapshot_source is not self.data:
+            self._snapshot = self._build_sensor_snapshot()
+            self._snapshot_source = self.data
+        return self._snapshot
+
+    def _build_sensor_snapshot(self) -> dict[str, Any]:
+        """Build the system sensor snapshot from the current coordinator data."""
+        health = self.get_health_data()
+        stats = self.get_stats_data()
+        dtu = self.get_dtu_data()
+
+        snapshot: dict[str, Any] = {
+            "dtu_status": "unknown",
+        }
+        if health:
+            snapshot["uptime_seconds"] = health.get("uptime_seconds")
+            snapshot["start_time"] = health.get("start_time")
+        if dtu:
+            snapshot["dtu_status"] = dtu.get("status")
+            snapshot["dtu_query_count"] = dtu.get("query_count")
+            snapshot["dtu_error_count"] = dtu.get("error_count")
+            snapshot["dtu_last_error"] = dtu.get("last_error")
+            snapshot["dtu_last_error_time"] = dtu.get("last_error_time")
+            snapshot["dtu_seconds_since_last_success"] = dtu.get("seconds_since_last_success")
+            snapshot["dtu_last_successful_query"] = dtu.get("last_successful_query")
+        if stats:
+            snapshot["database_size_mb"] = round(stats.get("database_size_bytes", 0) * BYTES_TO_MB, 2)
+            snapshot["total_records"] = stats.get("total_records")
+        return snapshot
+
     def get_inverters(self) -> list[dict[str, Any]]:
         """Get all inverters data from coordinator."""
         if self.data and "inverters" in self.data:
@@ -301,11 +378,14 @@ class HoymilesSmilesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Returns:
             Inverter data dict or None if not found
         """
-        inverters = self.get_inverters()
-        for inverter in inverters:
-            if inverter.get("serial_number") == serial_number:
-                return inverter
-        return None
+        if self._inverters_source is not self.data:
+            self._inverters_by_serial = {
+                inverter["serial_number"]: inverter
+                for inverter in self.get_inverters()
+                if inverter.get("serial_number")
+            }
+            self._inverters_source = self.data
+        return self._inverters_by_serial.get(serial_number)
     
     def get_port_data(self, serial_number: str, port_number: int) -> dict[str, Any] | None:
         """Get data for a specific port from cached coordinator data.
@@ -333,10 +413,11 @@ class HoymilesSmilesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Get latest data for a specific inverter including port data.
         
         DEPRECATED: This method makes API calls. Use get_inverter_data() instead for cached data.
-        This is only used during initial setup to discover port numbers.
+        This is only used during initial setup, for bridges whose inverter list
+        does not include port data.
         """
         try:
-            session = await self._get_session()
+            session = self._get_session()
             endpoint = f"/api/inverters/{serial_number}"
             
             # Fetch inverter data
@@ -366,8 +447,6 @@ class HoymilesSmilesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Args:
             data: Pushed data from the bridge
         """
-        import time
-        
         inverters = data.get("inverters", [])
         total_ports = sum(len(inv.get("ports", [])) for inv in inverters)
         
@@ -383,7 +462,7 @@ class HoymilesSmilesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "inverters": inverters,
             "available": True,
         }
-        self._last_push_update = time.time()
+        self._last_push_update = time.monotonic()
         
         # Reset consecutive failures on successful push
         if self._consecutive_failures > 0:
@@ -439,7 +518,7 @@ class HoymilesSmilesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             ws_url: Full WebSocket URL for the bridge to connect to
         """
         try:
-            session = await self._get_session()
+            session = self._get_session()
             endpoint = "/api/websocket/register"
             url = f"{self.base_url}{endpoint}"
             
@@ -454,7 +533,7 @@ class HoymilesSmilesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
             _LOGGER.debug("[WebSocket Registration] URL: %s", ws_url)
             
-            async with session.post(url, json=payload) as response:
+            async with session.post(url, json=payload, timeout=REQUEST_TIMEOUT) as response:
                 if response.status == 200:
                     _LOGGER.info(
                         "[WebSocket Registration] ✓ Successfully registered with bridge. "
@@ -479,11 +558,3 @@ class HoymilesSmilesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 "Check bridge connectivity.",
                 err
             )
-
-    async def async_shutdown(self) -> None:
-        """Shutdown coordinator and cleanup resources."""
-        if self._session and not self._session.closed:
-            _LOGGER.debug("Closing aiohttp session for %s:%s", self.host, self.port)
-            await self._session.close()
-            self._session = None
-
@@ -1,9 +1,12 @@
 """Sensor platform for Hoymiles S-Miles."""
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import partial
 import logging
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -15,6 +18,7 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -29,13 +33,14 @@ from .const import (
     OPERATING_STATUS_MAP,
     LINK_STATUS_MAP,
     ALARM_CODE_MAP,
+    SensorType,
 )
 from .coordinator import HoymilesSmilesCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, kw_only=True)
 class HoymilesSmilesSensorEntityDescription(SensorEntityDescription):
     """Describe Hoymiles S-Miles sensor entity."""
 
@@ -43,6 +48,74 @@ class HoymilesSmilesSensorEntityDescription(SensorEntityDescription):
     attributes_fn: Callable[[HoymilesSmilesCoordinator], dict[str, Any]] = None
 
 
+def _uptime_value(coordinator: HoymilesSmilesCoordinator) -> StateType:
+    return coordinator.get_sensor_snapshot().get("uptime_seconds")
+
+
+def _uptime_attributes(coordinator: HoymilesSmilesCoordinator) -> dict[str, Any]:
+    return {"start_time": coordinator.get_sensor_snapshot().get("start_time")}
+
+
+def _dtu_query_count_value(coordinator: HoymilesSmilesCoordinator) -> StateType:
+    return coordinator.get_sensor_snapshot().get("dtu_query_count")
+
+
+def _dtu_query_count_attributes(coordinator: HoymilesSmilesCoordinator) -> dict[str, Any]:
+    return {"dtu_status": coordinator.get_sensor_snapshot()["dtu_status"]}
+
+
+def _dtu_error_count_value(coordinator: HoymilesSmilesCoordinator) -> StateType:
+    return coordinator.get_sensor_snapshot().get("dtu_error_count")
+
+
+def _dtu_error_count_attributes(coordinator: HoymilesSmilesCoordinator) -> dict[str, Any]:
+    snapshot = coordinator.get_sensor_snapshot()
+    return {
+        "last_error": snapshot.get("dtu_last_error"),
+        "last_error_time": snapshot.get("dtu_last_error_time"),
+    }
+
+
+def _dtu_last_query_value(coordinator: HoymilesSmilesCoordinator) -> StateType:
+    return coordinator.get_sensor_snapshot().get("dtu_seconds_since_last_success")
+
+
+def _dtu_last_query_attributes(coordinator: HoymilesSmilesCoordinator) -> dict[str, Any]:
+    return {"last_successful_query": coordinator.get_sensor_snapshot().get("dtu_last_successful_query")}
+
+
+def _database_size_value(coordinator: HoymilesSmilesCoordinator) -> StateType:
+    return coordinator.get_sensor_snapshot().get("database_size_mb")
+
+
+def _cached_records_value(coordinator: HoymilesSmilesCoordinator) -> StateType:
+    return coordinator.get_sensor_snapshot().get("total_records")
+
+
+def _build_descriptions(
+    sensor_types: Mapping[str, SensorType],
+) -> Mapping[str, SensorEntityDescription]:
+    """Resolve a sensor type table into entity descriptions, keyed like the table."""
+    return MappingProxyType({
+        key: SensorEntityDescription(
+            key=key,
+            name=spec.name,
+            icon=spec.icon,
+            native_unit_of_measurement=spec.unit,
+            device_class=SensorDeviceClass(spec.device_class) if spec.device_class else None,
+            state_class=SensorStateClass(spec.state_class) if spec.state_class else None,
+            entity_category=EntityCategory(spec.entity_category) if spec.entity_category else None,
+        )
+        for key, spec in sensor_types.items()
+    })
+
+
+_INVERTER_DESCRIPTIONS = _build_descriptions(INVERTER_SENSOR_TYPES)
+_PORT_DESCRIPTIONS = _build_descriptions(PORT_SENSOR_TYPES)
+_AGGREGATE_DESCRIPTIONS = _build_descriptions(INVERTER_AGGREGATE_SENSORS)
+_DTU_DESCRIPTIONS = _build_descriptions(DTU_SENSOR_TYPES)
+
+
 SENSOR_DESCRIPTIONS: tuple[HoymilesSmilesSensorEntityDescription, ...] = (
     HoymilesSmilesSensorEntityDescription(
         key="uptime",
@@ -51,18 +124,8 @@ SENSOR_DESCRIPTIONS: tuple[HoymilesSmilesSensorEntityDescription, ...] = (
         native_unit_of_measurement="s",
         device_class=SensorDeviceClass.DURATION,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        value_fn=lambda coordinator: (
-            coordinator.get_health_data().get("uptime_seconds")
-            if coordinator.get_health_data()
-            else None
-        ),
-        attributes_fn=lambda coordinator: {
-            "start_time": (
-                coordinator.get_health_data().get("start_time")
-                if coordinator.get_health_data()
-                else None
-            ),
-        },
+        value_fn=_uptime_value,
+        attributes_fn=_uptime_attributes,
     ),
     HoymilesSmilesSensorEntityDescription(
         key="dtu_query_count",
@@ -70,18 +133,8 @@ SENSOR_DESCRIPTIONS: tuple[HoymilesSmilesSensorEntityDescription, ...] = (
         icon="mdi:counter",
         native_unit_of_measurement="queries",
         state_class=SensorStateClass.TOTAL_INCREASING,
-        value_fn=lambda coordinator: (
-            coordinator.get_dtu_data().get("query_count")
-            if coordinator.get_dtu_data()
-            else None
-        ),
-        attributes_fn=lambda coordinator: {
-            "dtu_status": (
-                coordinator.get_dtu_data().get("status")
-                if coordinator.get_dtu_data()
-                else "unknown"
-            ),
-        },
+        value_fn=_dtu_query_count_value,
+        attributes_fn=_dtu_query_count_attributes,
     ),
     HoymilesSmilesSensorEntityDescription(
         key="dtu_error_count",
@@ -89,23 +142,8 @@ SENSOR_DESCRIPTIONS: tuple[HoymilesSmilesSensorEntityDescription, ...] = (
         icon="mdi:alert-circle",
         native_unit_of_measurement="errors",
         state_class=SensorStateClass.TOTAL_INCREASING,
-        value_fn=lambda coordinator: (
-            coordinator.get_dtu_data().get("error_count")
-            if coordinator.get_dtu_data()
-            else None
-        ),
-        attributes_fn=lambda coordinator: {
-            "last_error": (
-                coordinator.get_dtu_data().get("last_error")
-                if coordinator.get_dtu_data()
-                else None
-            ),
-            "last_error_time": (
-                coordinator.get_dtu_data().get("last_error_time")
-                if coordinator.get_dtu_data()
-                else None
-            ),
-        },
+        value_fn=_dtu_error_count_value,
+        attributes_fn=_dtu_error_count_attributes,
     ),
     HoymilesSmilesSensorEntityDescription(
         key="dtu_last_query",
@@ -113,18 +151,8 @@ SENSOR_DESCRIPTIONS: tuple[HoymilesSmilesSensorEntityDescription, ...] = (
         icon="mdi:clock-check-outline",
         native_unit_of_measurement="s",
         device_class=SensorDeviceClass.DURATION,
-        value_fn=lambda coordinator: (
-            coordinator.get_dtu_data().get("seconds_since_last_success")
-            if coordinator.get_dtu_data()
-            else None
-        ),
-        attributes_fn=lambda coordinator: {
-            "last_successful_query": (
-                coordinator.get_dtu_data().get("last_successful_query")
-                if coordinator.get_dtu_data()
-                else None
-            ),
-        },
+        value_fn=_dtu_last_query_value,
+        attributes_fn=_dtu_last_query_attributes,
     ),
     HoymilesSmilesSensorEntityDescription(
         key="database_size",
@@ -134,11 +162,7 @@ SENSOR_DESCRIPTIONS: tuple[HoymilesSmilesSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         suggested_display_precision=2,
-        value_fn=lambda coordinator: (
-            round(coordinator.get_stats_data().get("database_size_bytes", 0) / 1024 / 1024, 2)
-            if coordinator.get_stats_data()
-            else None
-        ),
+        value_fn=_database_size_value,
     ),
     HoymilesSmilesSensorEntityDescription(
         key="cached_records",
@@ -147,11 +171,7 @@ SENSOR_DESCRIPTIONS: tuple[HoymilesSmilesSensorEntityDescription, ...] = (
         native_unit_of_measurement="records",
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda coordinator: (
-            coordinator.get_stats_data().get("total_records")
-            if coordinator.get_stats_data()
-            else None
-        ),
+        value_fn=_cached_records_value,
     ),
 )
 
@@ -175,26 +195,31 @@ async def async_setup_entry(
     _LOGGER.info("Setting up sensors for %d inverters", len(inverters))
     
     # Group inverters by DTU
-    dtus = {}
+    dtus: dict[str, list[dict[str, Any]]] = {}
     for inverter in inverters:
-        dtu_name = inverter.get("dtu_name", "Unknown DTU")
-        if dtu_name not in dtus:
-            dtus[dtu_name] = []
-        dtus[dtu_name].append(inverter)
+        dtus.setdefault(inverter.get("dtu_name", "Unknown DTU"), []).append(inverter)
     
     # Create DTU devices and sensors
     for dtu_name, dtu_inverters in dtus.items():
         _LOGGER.debug("Creating DTU device for %s with %d inverters", dtu_name, len(dtu_inverters))
-        for sensor_key in DTU_SENSOR_TYPES:
-            entities.append(
-                DtuSensor(
-                    coordinator=coordinator,
-                    entry=entry,
-                    dtu_name=dtu_name,
-                    sensor_key=sensor_key,
-                    inverter_count=len(dtu_inverters),
-                )
+        dtu_device_info: DeviceInfo = {
+            "identifiers": {(DOMAIN, f"dtu_{dtu_name}")},
+            "name": f"DTU {dtu_name}",
+            "manufacturer": "Hoymiles",
+            "model": "DTU",
+            "via_device": (DOMAIN, entry.entry_id),
+        }
+        entities.extend(
+            DtuSensor(
+                coordinator=coordinator,
+                entry=entry,
+                dtu_name=dtu_name,
+                sensor_key=sensor_key,
+                inverter_count=len(dtu_inverters),
+                device_info=dtu_device_info,
             )
+            for sensor_key in DTU_SENSOR_TYPES
+        )
     
     # Create inverter and port sensors
     for inverter in inverters:
@@ -203,56 +228,73 @@ async def async_setup_entry(
             continue
         
         _LOGGER.debug("Creating sensors for inverter %s", serial_number)
+        inverter_device_info: DeviceInfo = {
+            "identifiers": {(DOMAIN, serial_number)},
+            "name": f"Inverter {serial_number}",
+            "manufacturer": "Hoymiles",
+            "model": inverter.get("inverter_type", "Unknown"),
+            "via_device": (DOMAIN, entry.entry_id),
+        }
         
         # Create inverter-level sensors
-        for sensor_key in INVERTER_SENSOR_TYPES:
-            entities.append(
-                InverterSensor(
-                    coordinator=coordinator,
-                    entry=entry,
-                    serial_number=serial_number,
-                    sensor_key=sensor_key,
-                    inverter_info=inverter,
-                )
+        entities.extend(
+            InverterSensor(
+                coordinator=coordinator,
+                entry=entry,
+                serial_number=serial_number,
+                sensor_key=sensor_key,
+                inverter_info=inverter,
+                device_info=inverter_device_info,
             )
+            for sensor_key in INVERTER_SENSOR_TYPES
+        )
         
         # Create aggregate sensors (totals across all ports)
-        for sensor_key in INVERTER_AGGREGATE_SENSORS:
-            entities.append(
-                InverterAggregateSensor(
-                    coordinator=coordinator,
-                    entry=entry,
-                    serial_number=serial_number,
-                    sensor_key=sensor_key,
-                    inverter_info=inverter,
-                )
+        entities.extend(
+            InverterAggregateSensor(
+                coordinator=coordinator,
+                entry=entry,
+                serial_number=serial_number,
+                sensor_key=sensor_key,
+                inverter_info=inverter,
+                device_info=inverter_device_info,
             )
+            for sensor_key in INVERTER_AGGREGATE_SENSORS
+        )
         
         # Get port data to determine how many ports this inverter has
-        # We'll create sensors for all ports that have data
-        inverter_data = await coordinator.get_inverter_latest_data(serial_number)
+        # We'll create sensors for all ports that have data. The inverter list
+        # already carries the latest ports; only older bridges need a fetch.
+        inverter_data = inverter if "ports" in inverter else await coordinator.get_inverter_latest_data(serial_number)
         if inverter_data:
-            ports = inverter_data.get("ports", [])
-            port_numbers = set()
-            for port in ports:
-                port_num = port.get("port_number")
-                if port_num is not None:
-                    port_numbers.add(port_num)
+            port_numbers = {
+                port["port_number"]
+                for port in inverter_data.get("ports", [])
+                if port.get("port_number") is not None
+            }
             
             # Create port sensors for each port
             for port_number in sorted(port_numbers):
                 _LOGGER.debug("Creating sensors for inverter %s port %d", serial_number, port_number)
-                for sensor_key in PORT_SENSOR_TYPES:
-                    entities.append(
-                        PortSensor(
-                            coordinator=coordinator,
-                            entry=entry,
-                            serial_number=serial_number,
-                            port_number=port_number,
-                            sensor_key=sensor_key,
-                            inverter_info=inverter,
-                        )
+                port_device_info: DeviceInfo = {
+                    "identifiers": {(DOMAIN, f"{serial_number}_port{port_number}")},
+                    "name": f"Inverter {serial_number} Port {port_number}",
+                    "manufacturer": "Hoymiles",
+                    "model": f"Port {port_number}",
+                    "via_device": (DOMAIN, serial_number),  # Link to parent inverter
+                }
+                entities.extend(
+                    PortSensor(
+                        coordinator=coordinator,
+                        entry=entry,
+                        serial_number=serial_number,
+                        port_number=port_number,
+                        sensor_key=sensor_key,
+                        inverter_info=inverter,
+                        device_info=port_device_info,
                     )
+                    for sensor_key in PORT_SENSOR_TYPES
+                )
 
     async_add_entities(entities)
 
@@ -272,41 +314,7 @@ class HoymilesSmilesSensor(CoordinatorEntity[HoymilesSmilesCoordinator], SensorE
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": "Hoymiles S-Miles",
-            "manufacturer": "Hoymiles",
-            "model": "S-Miles Bridge",
-            "sw_version": "2.0.0",
-        }
-
-    async def async_added_to_hass(self) -> None:
-        """Handle entity added to hass."""
-        await super().async_added_to_hass()
-        
-        # Schedule initial state write after entity is fully registered
-        # Add a small delay to ensure recorder is ready
-        async def write_initial_state():
-            """Write initial state after recorder is ready."""
-            import asyncio
-            # Wait a moment for recorder to fully register the entity
-            await asyncio.sleep(0.5)
-            
-            _LOGGER.debug(
-                "[Initial State] Writing initial state for %s sensor: %s (available=%s)",
-                self.entity_description.name,
-                self.native_value,
-                self.available
-            )
-            self.async_write_ha_state()
-            
-            # Force another write after 1 second to be absolutely sure
-            await asyncio.sleep(1)
-            _LOGGER.debug("[Initial State] Writing second state for %s to ensure history capture", self.entity_description.name)
-            self.async_write_ha_state()
-        
-        # Schedule for execution
-        self.hass.async_create_task(write_initial_state())
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> StateType:
@@ -328,6 +336,71 @@ class HoymilesSmilesSensor(CoordinatorEntity[HoymilesSmilesCoordinator], SensorE
         return self.coordinator.last_update_success and self.coordinator.is_available()
 
 
+def _rounded_field(data: dict[str, Any], field: str, digits: int) -> StateType:
+    """Return data[field] rounded to digits, or None when it is missing."""
+    value = data.get(field)
+    return None if value is None else round(value, digits)
+
+
+def _operating_status_value(data: dict[str, Any]) -> StateType:
+    code = data.get("operating_status")
+    return OPERATING_STATUS_MAP.get(code, f"Unknown ({code})")
+
+
+def _link_status_value(data: dict[str, Any]) -> StateType:
+    code = data.get("link_status")
+    return LINK_STATUS_MAP.get(code, f"Unknown ({code})")
+
+
+def _alarm_code_value(data: dict[str, Any]) -> StateType:
+    code = data.get("alarm_code")
+    return ALARM_CODE_MAP.get(code, f"Unknown Alarm ({code})")
+
+
+def _alarm_count_value(data: dict[str, Any]) -> StateType:
+    return data.get("alarm_count")
+
+
+# Inverter sensor key -> function deriving its state from the inverter data
+_INVERTER_VALUE_FNS: Mapping[str, Callable[[dict[str, Any]], StateType]] = MappingProxyType({
+    "grid_voltage": partial(_rounded_field, field="grid_voltage", digits=2),
+    "grid_frequency": partial(_rounded_field, field="grid_frequency", digits=2),
+    "temperature": partial(_rounded_field, field="temperature", digits=1),
+    "operating_status": _operating_status_value,
+    "link_status": _link_status_value,
+    "alarm_code": _alarm_code_value,
+    "alarm_count": _alarm_count_value,
+})
+
+
+def _today_production_value(data: dict[str, Any]) -> StateType:
+    value = data.get("today_production")
+    return int(value) if value is not None else 0
+
+
+def _total_production_value(data: dict[str, Any]) -> StateType:
+    value = data.get("total_production")
+    # Convert Wh to kWh
+    return round(value / 1000, 2) if value is not None else 0
+
+
+# Port sensor key -> function deriving its state from the port data
+_PORT_VALUE_FNS: Mapping[str, Callable[[dict[str, Any]], StateType]] = MappingProxyType({
+    "pv_voltage": partial(_rounded_field, field="pv_voltage", digits=2),
+    "pv_current": partial(_rounded_field, field="pv_current", digits=3),
+    "pv_power": partial(_rounded_field, field="pv_power", digits=2),
+    "today_production": _today_production_value,
+    "total_production": _total_production_value,
+})
+
+# Status sensor key -> attribute exposing the raw numeric code
+_RAW_CODE_ATTRIBUTES: Mapping[str, str] = MappingProxyType({
+    "operating_status": "status_code",
+    "link_status": "status_code",
+    "alarm_code": "alarm_code_raw",
+})
+
+
 class InverterSensor(CoordinatorEntity[HoymilesSmilesCoordinator], SensorEntity):
     """Representation of a Hoymiles inverter-level sensor."""
 
@@ -338,45 +411,25 @@ class InverterSensor(CoordinatorEntity[HoymilesSmilesCoordinator], SensorEntity)
         serial_number: str,
         sensor_key: str,
         inverter_info: dict[str, Any],
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the inverter sensor."""
         super().__init__(coordinator)
         self._serial_number = serial_number
         self._sensor_key = sensor_key
-        self._inverter_info = inverter_info
+        # Only the DTU name is read from the inverter record after setup
+        self._dtu_name = inverter_info.get("dtu_name")
         self._attr_has_entity_name = True
         
-        # Get sensor configuration
-        sensor_config = INVERTER_SENSOR_TYPES[sensor_key]
+        # Prebuilt description carries name, icon, unit, classes and category
+        self.entity_description = _INVERTER_DESCRIPTIONS[sensor_key]
+        self._value_fn = _INVERTER_VALUE_FNS.get(sensor_key)
+        self._raw_code_attribute = _RAW_CODE_ATTRIBUTES.get(sensor_key)
         
         # Set unique ID
         self._attr_unique_id = f"{entry.entry_id}_{serial_number}_{sensor_key}"
         
-        # Set entity attributes from sensor configuration
-        self._attr_name = sensor_config["name"]
-        self._attr_icon = sensor_config["icon"]
-        self._attr_native_unit_of_measurement = sensor_config.get("unit")
-        
-        # Device class
-        if sensor_config.get("device_class"):
-            self._attr_device_class = SensorDeviceClass(sensor_config["device_class"])
-        
-        # State class
-        if sensor_config.get("state_class"):
-            self._attr_state_class = SensorStateClass(sensor_config["state_class"])
-        
-        # Entity category
-        if sensor_config.get("entity_category"):
-            self._attr_entity_category = EntityCategory(sensor_config["entity_category"])
-        
-        # Device info - create a device for each inverter
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, serial_number)},
-            "name": f"Inverter {serial_number}",
-            "manufacturer": "Hoymiles",
-            "model": inverter_info.get("inverter_type", "Unknown"),
-            "via_device": (DOMAIN, entry.entry_id),
-        }
+        self._attr_device_info = device_info
         
         # Cache for latest data
         self._latest_data: dict[str, Any] | None = None
@@ -393,23 +446,6 @@ class InverterSensor(CoordinatorEntity[HoymilesSmilesCoordinator], SensorEntity)
             self._serial_number, self._sensor_key, 
             "available" if self._latest_data else "no data yet"
         )
-        
-        # Schedule initial state write
-        async def write_initial_state():
-            """Write initial state after recorder is ready."""
-            import asyncio
-            await asyncio.sleep(0.5)
-            
-            _LOGGER.debug(
-                "[Initial State] Writing initial state for inverter %s sensor %s: %s",
-                self._serial_number, self._sensor_key, self.native_value
-            )
-            self.async_write_ha_state()
-            
-            await asyncio.sleep(1)
-            self.async_write_ha_state()
-        
-        self.hass.async_create_task(write_initial_state())
 
     async def async_update(self) -> None:
         """Update the entity."""
@@ -423,35 +459,7 @@ class InverterSensor(CoordinatorEntity[HoymilesSmilesCoordinator], SensorEntity)
         if not self._latest_data:
             return None
         
-        # Map sensor keys to data fields (inverter-level only)
-        if self._sensor_key == "grid_voltage":
-            value = self._latest_data.get("grid_voltage")
-            return round(value, 2) if value is not None else None
-        
-        elif self._sensor_key == "grid_frequency":
-            value = self._latest_data.get("grid_frequency")
-            return round(value, 2) if value is not None else None
-        
-        elif self._sensor_key == "temperature":
-            value = self._latest_data.get("temperature")
-            return round(value, 1) if value is not None else None
-        
-        elif self._sensor_key == "operating_status":
-            code = self._latest_data.get("operating_status")
-            return OPERATING_STATUS_MAP.get(code, f"Unknown ({code})")
-        
-        elif self._sensor_key == "link_status":
-            code = self._latest_data.get("link_status")
-            return LINK_STATUS_MAP.get(code, f"Unknown ({code})")
-        
-        elif self._sensor_key == "alarm_code":
-            code = self._latest_data.get("alarm_code")
-            return ALARM_CODE_MAP.get(code, f"Unknown Alarm ({code})")
-        
-        elif self._sensor_key == "alarm_count":
-            return self._latest_data.get("alarm_count")
-        
-        return None
+        return self._value_fn(self._latest_data) if self._value_fn else None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -461,7 +469,7 @@ class InverterSensor(CoordinatorEntity[HoymilesSmilesCoordinator], SensorEntity)
         
         attributes = {
             "serial_number": self._serial_number,
-            "dtu_name": self._inverter_info.get("dtu_name"),
+            "dtu_name": self._dtu_name,
             "last_seen": self._latest_data.get("timestamp"),
         }
         
@@ -471,12 +479,8 @@ class InverterSensor(CoordinatorEntity[HoymilesSmilesCoordinator], SensorEntity)
             attributes["port_count"] = len(ports)
         
         # Add raw numeric codes for status sensors
-        if self._sensor_key == "operating_status":
-            attributes["status_code"] = self._latest_data.get("operating_status")
-        elif self._sensor_key == "link_status":
-            attributes["status_code"] = self._latest_data.get("link_status")
-        elif self._sensor_key == "alarm_code":
-            attributes["alarm_code_raw"] = self._latest_data.get("alarm_code")
+        if self._raw_code_attribute:
+            attributes[self._raw_code_attribute] = self._latest_data.get(self._sensor_key)
         
         return attributes
 
@@ -501,46 +505,25 @@ class PortSensor(CoordinatorEntity[HoymilesSmilesCoordinator], SensorEntity):
         port_number: int,
         sensor_key: str,
         inverter_info: dict[str, Any],
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the port sensor."""
         super().__init__(coordinator)
         self._serial_number = serial_number
         self._port_number = port_number
         self._sensor_key = sensor_key
-        self._inverter_info = inverter_info
+        # Only the DTU name is read from the inverter record after setup
+        self._dtu_name = inverter_info.get("dtu_name")
         self._attr_has_entity_name = True
         
-        # Get sensor configuration
-        sensor_config = PORT_SENSOR_TYPES[sensor_key]
+        # Prebuilt description carries name, icon, unit, classes and category
+        self.entity_description = _PORT_DESCRIPTIONS[sensor_key]
+        self._value_fn = _PORT_VALUE_FNS.get(sensor_key)
         
         # Set unique ID
         self._attr_unique_id = f"{entry.entry_id}_{serial_number}_port{port_number}_{sensor_key}"
         
-        # Set entity attributes from sensor configuration
-        self._attr_name = sensor_config["name"]
-        self._attr_icon = sensor_config["icon"]
-        self._attr_native_unit_of_measurement = sensor_config.get("unit")
-        
-        # Device class
-        if sensor_config.get("device_class"):
-            self._attr_device_class = SensorDeviceClass(sensor_config["device_class"])
-        
-        # State class
-        if sensor_config.get("state_class"):
-            self._attr_state_class = SensorStateClass(sensor_config["state_class"])
-        
-        # Entity category
-        if sensor_config.get("entity_category"):
-            self._attr_entity_category = EntityCategory(sensor_config["entity_category"])
-        
-        # Device info - create a port device under the inverter
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"{serial_number}_port{port_number}")},
-            "name": f"Inverter {serial_number} Port {port_number}",
-            "manufacturer": "Hoymiles",
-            "model": f"Port {port_number}",
-            "via_device": (DOMAIN, serial_number),  # Link to parent inverter
-        }
+        self._attr_device_info = device_info
         
         # Cache for latest data
         self._port_data: dict[str, Any] | None = None
@@ -557,23 +540,6 @@ class PortSensor(CoordinatorEntity[HoymilesSmilesCoordinator], SensorEntity):
             self._serial_number, self._port_number, self._sensor_key,
             "available" if self._port_data else "no data yet"
         )
-        
-        # Schedule initial state write
-        async def write_initial_state():
-            """Write initial state after recorder is ready."""
-            import asyncio
-            await asyncio.sleep(0.5)
-            
-            _LOGGER.debug(
-                "[Initial State] Writing initial state for inverter %s port %d sensor %s: %s",
-                self._serial_number, self._port_number, self._sensor_key, self.native_value
-            )
-            self.async_write_ha_state()
-            
-            await asyncio.sleep(1)
-            self.async_write_ha_state()
-        
-        self.hass.async_create_task(write_initial_state())
 
     async def async_update(self) -> None:
         """Update the entity."""
@@ -587,29 +553,7 @@ class PortSensor(CoordinatorEntity[HoymilesSmilesCoordinator], SensorEntity):
         if not self._port_data:
             return None
         
-        # Map sensor keys to port data fields
-        if self._sensor_key == "pv_voltage":
-            value = self._port_data.get("pv_voltage")
-            return round(value, 2) if value is not None else None
-        
-        elif self._sensor_key == "pv_current":
-            value = self._port_data.get("pv_current")
-            return round(value, 3) if value is not None else None
-        
-        elif self._sensor_key == "pv_power":
-            value = self._port_data.get("pv_power")
-            return round(value, 2) if value is not None else None
-        
-        elif self._sensor_key == "today_production":
-            value = self._port_data.get("today_production")
-            return int(value) if value is not None else 0
-        
-        elif self._sensor_key == "total_production":
-            value = self._port_data.get("total_production")
-            # Convert Wh to kWh
-            return round(value / 1000, 2) if value is not None else 0
-        
-        return None
+        return self._value_fn(self._port_data) if self._value_fn else None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -620,7 +564,7 @@ class PortSensor(CoordinatorEntity[HoymilesSmilesCoordinator], SensorEntity):
         attributes = {
             "serial_number": self._serial_number,
             "port_number": self._port_number,
-            "dtu_name": self._inverter_info.get("dtu_name"),
+            "dtu_name": self._dtu_name,
             "last_seen": self._port_data.get("timestamp"),
         }
         
@@ -646,54 +590,31 @@ class InverterAggregateSensor(CoordinatorEntity[HoymilesSmilesCoordinator], Sens
         serial_number: str,
         sensor_key: str,
         inverter_info: dict[str, Any],
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the aggregate sensor."""
         super().__init__(coordinator)
         self._serial_number = serial_number
         self._sensor_key = sensor_key
-        self._inverter_info = inverter_info
         self._attr_has_entity_name = True
         
-        # Get sensor configuration
-        sensor_config = INVERTER_AGGREGATE_SENSORS[sensor_key]
+        # Prebuilt description carries name, icon, unit, classes and category
+        self.entity_description = _AGGREGATE_DESCRIPTIONS[sensor_key]
         
         # Set unique ID
         self._attr_unique_id = f"{entry.entry_id}_{serial_number}_{sensor_key}"
         
-        # Set entity attributes from sensor configuration
-        self._attr_name = sensor_config["name"]
-        self._attr_icon = sensor_config["icon"]
-        self._attr_native_unit_of_measurement = sensor_config.get("unit")
-        
-        # Device class
-        if sensor_config.get("device_class"):
-            self._attr_device_class = SensorDeviceClass(sensor_config["device_class"])
-        
-        # State class
-        if sensor_config.get("state_class"):
-            self._attr_state_class = SensorStateClass(sensor_config["state_class"])
+        self._attr_device_info = device_info
         
-        # Entity category
-        if sensor_config.get("entity_category"):
-            self._attr_entity_category = EntityCategory(sensor_config["entity_category"])
-        
-        # Device info - attach to inverter device
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, serial_number)},
-            "name": f"Inverter {serial_number}",
-            "manufacturer": "Hoymiles",
-            "model": inverter_info.get("inverter_type", "Unknown"),
-            "via_device": (DOMAIN, entry.entry_id),
-        }
-        
-        # Cache for latest data
+        # Cache for latest data and the state derived from it
         self._latest_data: dict[str, Any] | None = None
+        self._total: StateType = None
+        self._attributes: dict[str, Any] = {}
 
     async def async_added_to_hass(self) -> None:
         """Handle entity added to hass."""
         await super().async_added_to_hass()
-        # Get cached data from coordinator (no API call)
-        self._latest_data = self.coordinator.get_inverter_data(self._serial_number)
+        self._update_from_coordinator()
         
         _LOGGER.debug(
             "[Sensor Init] InverterAggregateSensor %s/%s using cached data: %s",
@@ -704,57 +625,57 @@ class InverterAggregateSensor(CoordinatorEntity[HoymilesSmilesCoordinator], Sens
     async def async_update(self) -> None:
         """Update the entity."""
         await super().async_update()
+        self._update_from_coordinator()
+
+    def _update_from_coordinator(self) -> None:
+        """Refresh cached inverter data and aggregate the ports once per update."""
         # Get cached data from coordinator (no API call)
         self._latest_data = self.coordinator.get_inverter_data(self._serial_number)
-
-    @property
-    def native_value(self) -> StateType:
-        """Return the state of the sensor."""
         if not self._latest_data:
-            return None
+            self._total = None
+            self._attributes = {}
+            return
         
-        ports = self._latest_data.get("ports", [])
-        if not ports:
-            return 0 if self._sensor_key in ["total_power", "total_today_production"] else 0.0
+        ports = self._latest_data.get("ports") or ()
+        attributes: dict[str, Any] = {
+            "serial_number": self._serial_number,
+            "port_count": len(ports),
+        }
         
-        # Aggregate values across all ports
+        # Aggregate values across all ports, with a per-port breakdown
+        total = 0
         if self._sensor_key == "total_power":
-            total = sum(port.get("pv_power", 0) or 0 for port in ports)
-            return round(total, 2)
-        
+            for idx, port in enumerate(ports, 1):
+                value = port.get("pv_power", 0) or 0
+                total += value
+                attributes[f"port_{port.get('port_number', idx)}_power"] = round(value, 2)
+            self._total = round(total, 2)
         elif self._sensor_key == "total_today_production":
-            total = sum(port.get("today_production", 0) or 0 for port in ports)
-            return int(total)
-        
+            for idx, port in enumerate(ports, 1):
+                value = port.get("today_production", 0) or 0
+                total += value
+                attributes[f"port_{port.get('port_number', idx)}_today"] = int(value)
+            self._total = int(total)
         elif self._sensor_key == "total_lifetime_production":
-            total = sum(port.get("total_production", 0) or 0 for port in ports)
-            return round(total / 1000, 2)  # Convert Wh to kWh
+            for idx, port in enumerate(ports, 1):
+                value = port.get("total_production", 0) or 0
+                total += value
+                attributes[f"port_{port.get('port_number', idx)}_total_kwh"] = round(value / 1000, 2)
+            self._total = round(total / 1000, 2)  # Convert Wh to kWh
+        else:
+            self._total = None
         
-        return None
+        self._attributes = attributes
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        return self._total
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        if not self._latest_data:
-            return {}
-        
-        ports = self._latest_data.get("ports", [])
-        attributes = {
-            "serial_number": self._serial_number,
-            "port_count": len(ports),
-        }
-        
-        # Add per-port breakdown
-        for idx, port in enumerate(ports, 1):
-            port_num = port.get("port_number", idx)
-            if self._sensor_key == "total_power":
-                attributes[f"port_{port_num}_power"] = round(port.get("pv_power", 0) or 0, 2)
-            elif self._sensor_key == "total_today_production":
-                attributes[f"port_{port_num}_today"] = int(port.get("today_production", 0) or 0)
-            elif self._sensor_key == "total_lifetime_production":
-                attributes[f"port_{port_num}_total_kwh"] = round((port.get("total_production", 0) or 0) / 1000, 2)
-        
-        return attributes
+        return self._attributes
 
     @property
     def available(self) -> bool:
@@ -776,6 +697,7 @@ class DtuSensor(CoordinatorEntity[HoymilesSmilesCoordinator], SensorEntity):
         dtu_name: str,
         sensor_key: str,
         inverter_count: int,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the DTU sensor."""
         super().__init__(coordinator)
@@ -784,43 +706,17 @@ class DtuSensor(CoordinatorEntity[HoymilesSmilesCoordinator], SensorEntity):
         self._inverter_count = inverter_count
         self._attr_has_entity_name = True
         
-        # Get sensor configuration
-        sensor_config = DTU_SENSOR_TYPES[sensor_key]
+        # Prebuilt description carries name, icon, unit, classes and category
+        self.entity_description = _DTU_DESCRIPTIONS[sensor_key]
         
         # Set unique ID
         self._attr_unique_id = f"{entry.entry_id}_dtu_{dtu_name}_{sensor_key}"
         
-        # Set entity attributes from sensor configuration
-        self._attr_name = sensor_config["name"]
-        self._attr_icon = sensor_config["icon"]
-        self._attr_native_unit_of_measurement = sensor_config.get("unit")
-        
-        # Device class
-        if sensor_config.get("device_class"):
-            self._attr_device_class = SensorDeviceClass(sensor_config["device_class"])
-        
-        # State class
-        if sensor_config.get("state_class"):
-            self._attr_state_class = SensorStateClass(sensor_config["state_class"])
-        
-        # Entity category
-        if sensor_config.get("entity_category"):
-            self._attr_entity_category = EntityCategory(sensor_config["entity_category"])
-        
-        # Device info - create a DTU device
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"dtu_{dtu_name}")},
-            "name": f"DTU {dtu_name}",
-            "manufacturer": "Hoymiles",
-            "model": "DTU",
-            "via_device": (DOMAIN, entry.entry_id),
-        }
+        self._attr_device_info = device_info
 
     @property
     def native_value(self) -> StateType:
         """Return the state of the sensor."""
-        health_data = self.coordinator.get_health_data()
-        
         if self._sensor_key == "inverter_count":
             return self._inverter_count
         
@@ -836,13 +732,13 @@ class DtuSensor(CoordinatorEntity[HoymilesSmilesCoordinator], SensorEntity):
             return total_power
         
         # DTU-specific stats from health data
+        health_data = self.coordinator.get_health_data()
         if health_data and "dtus" in health_data:
             dtu_data = health_data.get("dtus", {}).get(self._dtu_name, {})
             
             if self._sensor_key == "last_query_time":
                 last_query = dtu_data.get("last_successful_query")
                 if last_query:
-                    from datetime import datetime, timezone
                     try:
                         # Parse ISO format timestamp and ensure it has timezone
                         dt = datetime.fromisoformat(last_query.replace('Z', '+00:00'))
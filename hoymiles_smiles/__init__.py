@@ -6,7 +6,7 @@ __author__ = """Mariusz Wasiluk"""
 __email__ = 'foo@bar.com'
 __version__ = '0.12.0'
 
-MI_ENTITIES = [
+MI_ENTITIES = (
     'grid_voltage',
     'grid_frequency',
     'temperature',
@@ -14,14 +14,25 @@ MI_ENTITIES = [
     'alarm_code',
     'alarm_count',
     'link_status',
-]
+)
 
-PORT_ENTITIES = ['pv_voltage', 'pv_current', 'pv_power', 'today_production', 'total_production']
+PORT_ENTITIES = ('pv_voltage', 'pv_current', 'pv_power', 'today_production', 'total_production')
 
 _main_logger = logging.getLogger(__name__)
 
-# Expose main configuration classes
-from hoymiles_smiles.config import AppConfig, DatabaseConfig, DtuConfig
+# Main configuration classes, loaded on first access so that importing the
+# package (e.g. for `python -m hoymiles_smiles --help`) does not load pydantic
+_CONFIG_EXPORTS = ('AppConfig', 'DatabaseConfig', 'DtuConfig')
+
+
+def __getattr__(name):
+    """Import AppConfig, DatabaseConfig and DtuConfig lazily on first access."""
+    if name in _CONFIG_EXPORTS:
+        from hoymiles_smiles import config
+
+        return getattr(config, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     '__version__',
@@ -1,34 +1,114 @@
 """Enhanced Hoymiles S-Miles application with all features."""
 
 import argparse
+import asyncio
+import copy
+import functools
 import logging
+import os
 import sys
 import threading
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Sequence, Tuple
 
 import configargparse
 
 from hoymiles_smiles import __version__
-from hoymiles_smiles.circuit_breaker import ErrorRecoveryManager
-from hoymiles_smiles.config import AppConfig
-from hoymiles_smiles.health import HealthCheckServer, HealthMetrics
-from hoymiles_smiles.influxdb_client import InfluxDBWriter
-from hoymiles_smiles.logging_config import setup_logging
-from hoymiles_smiles.persistence import PersistenceManager
-from hoymiles_smiles.runners import (
-    MultiDtuCoordinator,
-    run_periodic_coordinator,
-    setup_signal_handlers,
-)
-from hoymiles_smiles.websocket_client import WebSocketClient
+
+# Config models (pydantic), logging setup and subsystems (database drivers,
+# Modbus, Prometheus, aiohttp, InfluxDB) are imported in main() once the
+# arguments are parsed, so --help and argument errors do not pay for loading them.
 
 logger = logging.getLogger(__name__)
 
+_TITLE = f'Hoymiles S-Miles Bridge v{__version__}'
+_BANNER = '=' * 60
+
+# parse_args() results keyed on their inputs (see _parse_args_key)
+_ARGS_CACHE: Dict[Tuple, argparse.Namespace] = {}
+
+
+def _config_file_key(path: Optional[str]) -> Optional[str]:
+    """Identify the current contents of a config file for the parse_args() memo.
+
+    The key changes whenever the file is modified, so an edited config file is
+    parsed again.
+
+    Args:
+        path: Config file path, or None if no config file was given
+
+    Returns:
+        Key, or None if the file cannot be stat'ed
+    """
+    if not path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _config_path_from_argv(argv: Sequence[str]) -> Optional[str]:
+    """Return the config file path given with -c/--config, if any."""
+    for i, arg in enumerate(argv):
+        if arg in ('-c', '--config'):
+            return argv[i + 1] if i + 1 < len(argv) else None
+        if arg.startswith('--config='):
+            return arg.split('=', 1)[1]
+    return None
+
+
+def _parse_args_key(argv: Sequence[str], env: Dict[str, str]) -> Tuple:
+    """Build the memo key for parse_args().
+
+    The result depends only on the command line, the relevant environment
+    variables and the config file, so the key covers all three.
+    """
+    return (
+        tuple(argv),
+        tuple(sorted(env.items())),
+        _config_file_key(_config_path_from_argv(argv)),
+    )
+
+
+def _env_snapshot() -> Dict[str, str]:
+    """Read every environment variable the parser understands in one sweep."""
+    environ = os.environ
+    return {name: environ[name] for name in _parser_env_vars() if name in environ}
+
 
 def parse_args() -> argparse.Namespace:
-    """Parse command line arguments."""
+    """Parse command line arguments.
+
+    Results are memoized on the command line, environment and config file
+    state, so re-entering main() (e.g. on reload) does not re-run the parser.
+    A copy is returned so callers may modify it.
+    """
+    argv = sys.argv[1:]
+    env = _env_snapshot()
+    key = _parse_args_key(argv, env)
+    cached = _ARGS_CACHE.get(key)
+    if cached is None:
+        cached = _ARGS_CACHE[key] = _build_parser().parse_args(argv, env_vars=env)
+    return copy.copy(cached)
+
+
+@functools.lru_cache(maxsize=None)
+def _parser_env_vars() -> Tuple[str, ...]:
+    """Names of the environment variables registered on the parser."""
+    return tuple(action.env_var for action in _build_parser()._actions if getattr(action, 'env_var', None))
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> configargparse.ArgParser:
+    """Build the command line / environment / config file parser.
+
+    The schema is fixed for the lifetime of the process, so it is built once
+    and reused by every parse_args() call that misses the memo.
+    """
     parser = configargparse.ArgParser(
-        description=f'Hoymiles S-Miles Bridge v{__version__}',
+        description=_TITLE,
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
         prog='python3 -m hoymiles_smiles',
         config_file_parser_class=configargparse.YAMLConfigFileParser,
@@ -124,7 +204,7 @@ def parse_args() -> argparse.Namespace:
     advanced_group.add('--dump-data-path', env_var='DUMP_DATA_PATH',
                        help='Path for data dump file')
     
-    return parser.parse_args()
+    return parser
 
 
 def main():
@@ -132,8 +212,15 @@ def main():
     # Parse arguments
     args = parse_args()
     
-    # Convert args to config
-    config = AppConfig(**vars(args))
+    from hoymiles_smiles.config import AppConfig
+    from hoymiles_smiles.logging_config import setup_logging
+    
+    # Convert args to config; AppConfig validates itself on construction
+    try:
+        config = AppConfig(**vars(args))
+    except Exception as e:
+        logger.error(f"Configuration validation failed: {e}")
+        sys.exit(1)
     
     # Setup logging
     logging_config = config.get_logging_config()
@@ -144,28 +231,24 @@ def main():
         console=logging_config.console,
     )
     
-    logger.info("=" * 60)
-    logger.info(f"Hoymiles S-Miles Bridge v{__version__}")
-    logger.info("=" * 60)
-    
-    # Validate configuration
-    try:
-        config.validate_config()
-    except Exception as e:
-        logger.error(f"Configuration validation failed: {e}")
-        sys.exit(1)
+    # Banner and summary are skipped entirely at the default WARNING level
+    log_summary = logger.isEnabledFor(logging.INFO)
+    if log_summary:
+        logger.info(_BANNER)
+        logger.info(_TITLE)
+        logger.info(_BANNER)
     
     # Log configuration summary
     dtu_configs = config.get_dtu_configs()
-    logger.info(f"Configured DTUs: {len(dtu_configs)}")
-    for dtu in dtu_configs:
-        logger.info(f"  - {dtu.name}: {dtu.host}:{dtu.port}")
-    
     db_config = config.get_database_config()
-    logger.info(f"Database: {db_config.type}://{db_config.host}:{db_config.port}/{db_config.database}")
-    logger.info(f"Query Period: {config.query_period}s")
-    logger.info(f"Timezone: {config.timezone}")
-    logger.info(f"Reset Hour: {config.reset_hour}:00")
+    if log_summary:
+        logger.info("Configured DTUs: %d", len(dtu_configs))
+        for dtu in dtu_configs:
+            logger.info("  - %s: %s:%s", dtu.name, dtu.host, dtu.port)
+        logger.info("Database: %s://%s:%s/%s", db_config.type, db_config.host, db_config.port, db_config.database)
+        logger.info("Query Period: %ss", config.query_period)
+        logger.info("Timezone: %s", config.timezone)
+        logger.info("Reset Hour: %s:00", config.reset_hour)
     
     if config.dry_run:
         logger.warning("Running in DRY RUN mode - no data will be published")
@@ -173,40 +256,59 @@ def main():
     # Initialize components
     logger.info("Initializing components...")
     
-    # Persistence
-    persistence_config = config.get_persistence_config()
-    db_config = config.get_database_config()
-    
-    persistence_manager = PersistenceManager(
-        enabled=persistence_config.enabled,
-        type=db_config.type,
-        host=db_config.host,
-        port=db_config.port,
-        database=db_config.database,
-        user=db_config.user,
-        password=db_config.password,
+    from hoymiles_smiles.circuit_breaker import ErrorRecoveryManager
+    from hoymiles_smiles.health import HealthMetrics
+    from hoymiles_smiles.persistence import PersistenceManager
+    from hoymiles_smiles.runners import (
+        MultiDtuCoordinator,
+        run_periodic_coordinator,
+        setup_signal_handlers,
     )
+    from hoymiles_smiles.websocket_client import WebSocketClient
     
-    # Health metrics
-    health_metrics = HealthMetrics()
-    
-    # WebSocket client for push updates
-    websocket_client = WebSocketClient(enabled=True)
-    logger.info("WebSocket client initialized for push updates")
-    
-    # InfluxDB writer (optional)
+    # Persistence and InfluxDB each open a network connection on construction
+    # and do not depend on each other, so build them concurrently.
+    persistence_config = config.get_persistence_config()
     influxdb_config = config.get_influxdb_config()
-    influxdb_writer = None
-    if influxdb_config.enabled:
-        influxdb_writer = InfluxDBWriter(
+
+    def create_influxdb_writer():
+        from hoymiles_smiles.influxdb_client import InfluxDBWriter
+
+        return InfluxDBWriter(
             enabled=True,
             host=influxdb_config.host,
             token=influxdb_config.token,
             database=influxdb_config.database,
             org=influxdb_config.org,
         )
+
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="init") as executor:
+        persistence_future = executor.submit(
+            PersistenceManager,
+            enabled=persistence_config.enabled,
+            type=db_config.type,
+            host=db_config.host,
+            port=db_config.port,
+            database=db_config.database,
+            user=db_config.user,
+            password=db_config.password,
+        )
+        influxdb_future = executor.submit(create_influxdb_writer) if influxdb_config.enabled else None
+
+        # Health metrics
+        health_metrics = HealthMetrics()
+        health_metrics.warm(dtu.name for dtu in dtu_configs)
+
+        # WebSocket client for push updates
+        websocket_client = WebSocketClient(enabled=True)
+        logger.info("WebSocket client initialized for push updates")
+
+        persistence_manager = persistence_future.result()
+        influxdb_writer = influxdb_future.result() if influxdb_future else None
+
+    if influxdb_writer is not None:
         if influxdb_writer.enabled:
-            logger.info(f"InfluxDB writer initialized: {influxdb_config.host}/{influxdb_config.database}")
+            logger.info("InfluxDB writer initialized: %s/%s", influxdb_config.host, influxdb_config.database)
         else:
             logger.warning("InfluxDB writer failed to initialize")
     
@@ -226,6 +328,8 @@ def main():
     # Health check server
     health_server = None
     if config.health_enabled:
+        from hoymiles_smiles.health import HealthCheckServer
+        
         health_server = HealthCheckServer(
             host=config.health_host,
             port=config.health_port,
@@ -265,12 +369,8 @@ def main():
         # Close WebSocket client
         if websocket_client:
             logger.info("Closing WebSocket client...")
-            import asyncio
             try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(websocket_client.close())
-                loop.close()
+                asyncio.run(websocket_client.close())
             except Exception as e:
                 logger.error(f"Error closing WebSocket client: {e}")
         
@@ -280,7 +380,7 @@ def main():
             persistence_manager.close()
         
         logger.info("Shutdown complete")
-        logger.info("=" * 60)
+        logger.info(_BANNER)
 
 
 if __name__ == '__main__':
@@ -1,49 +1,93 @@
 """Configuration management with Pydantic validation."""
 
+import functools
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Annotated, Any, Callable, Dict, FrozenSet, List, Literal, Mapping, Optional, Tuple, Type, TypeVar
 
-from pydantic import BaseModel, Field, field_validator, model_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    NonNegativeFloat,
+    NonNegativeInt,
+    PositiveInt,
+    PrivateAttr,
+    StringConstraints,
+    field_validator,
+    model_validator,
+)
+from pydantic_settings import BaseSettings, PydanticBaseSettingsSource, SettingsConfigDict
+
+from hoymiles_smiles import MI_ENTITIES, PORT_ENTITIES
+
+_T = TypeVar('_T')
+
+# Constrained types shared across models so pydantic builds each schema once
+Port = Annotated[int, Field(ge=1, le=65535)]
+UnitId = Annotated[int, Field(ge=1, le=255)]
+Hour = Annotated[int, Field(ge=0, le=23)]
+
+# Read-only empty default shared by the frozen mapping fields
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+# Hostnames and similar values: surrounding whitespace stripped, must not be empty
+NonEmptyStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+
+
+# _sub_configs key holding the field dict the cached results were built from
+_CACHE_OWNER = '__owner__'
+
+
+def _cached_sub_config(method: Callable[['AppConfig'], _T]) -> Callable[['AppConfig'], _T]:
+    """Cache the result of an AppConfig.get_*() builder on the instance.
+
+    The cache is cleared whenever a field of the AppConfig is assigned. It
+    also records the field dict it was built from, so copies made with
+    model_copy() (which share the original's private attributes but get a new
+    field dict) start with an empty cache instead of the original's results.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self: 'AppConfig') -> _T:
+        cache = self._sub_configs
+        if cache.get(_CACHE_OWNER) is not self.__dict__:
+            cache = self._sub_configs = {_CACHE_OWNER: self.__dict__}
+        try:
+            return cache[name]
+        except KeyError:
+            result = cache[name] = method(self)
+            return result
+
+    return wrapper
 
 
 class DtuConfig(BaseModel):
     """Configuration for a single DTU."""
 
-    name: str = Field(default="DTU", description="Friendly name for the DTU")
-    host: str = Field(..., description="DTU hostname or IP address")
-    port: int = Field(default=502, ge=1, le=65535, description="DTU Modbus port")
-    unit_id: int = Field(default=1, ge=1, le=255, description="Modbus unit ID")
-    
-    @field_validator('host')
-    @classmethod
-    def validate_host(cls, v: str) -> str:
-        """Validate host is not empty."""
-        if not v or not v.strip():
-            raise ValueError("DTU host cannot be empty")
-        return v.strip()
+    model_config = ConfigDict(frozen=True)
+
+    name: str = "DTU"  # Friendly name for the DTU
+    host: NonEmptyStr  # DTU hostname or IP address
+    port: Port = 502  # DTU Modbus port
+    unit_id: UnitId = 1  # Modbus unit ID
 
 
 class DatabaseConfig(BaseModel):
     """Database configuration."""
 
-    type: str = Field(default="postgres", description="Database type (postgres)")
-    host: str = Field(default="localhost", description="Database host")
-    port: int = Field(default=5432, ge=1, le=65535, description="Database port")
-    database: str = Field(default="hoymiles", description="Database name")
-    user: str = Field(default="hoymiles", description="Database user")
-    password: str = Field(default="", description="Database password")
-    pool_size: int = Field(default=10, ge=1, description="Connection pool size")
-    max_overflow: int = Field(default=20, ge=0, description="Maximum pool overflow")
-    
-    @field_validator('host')
-    @classmethod
-    def validate_host(cls, v: str) -> str:
-        """Validate host is not empty."""
-        if not v or not v.strip():
-            raise ValueError("Database host cannot be empty")
-        return v.strip()
+    model_config = ConfigDict(frozen=True)
+
+    type: str = "postgres"  # Database type (postgres)
+    host: NonEmptyStr = "localhost"  # Database host
+    port: Port = 5432  # Database port
+    database: str = "hoymiles"  # Database name
+    user: str = "hoymiles"  # Database user
+    password: str = ""  # Database password
+    pool_size: PositiveInt = 10  # Connection pool size
+    max_overflow: NonNegativeInt = 20  # Maximum pool overflow
     
     @field_validator('type')
     @classmethod
@@ -64,10 +108,12 @@ class DatabaseConfig(BaseModel):
 class ModbusConfig(BaseModel):
     """Modbus communication parameters."""
 
-    timeout: int = Field(default=3, ge=1, description="Request timeout in seconds")
-    retries: int = Field(default=3, ge=0, description="Max retries per request")
-    reconnect_delay: float = Field(default=0, ge=0, description="Minimum reconnect delay in seconds")
-    reconnect_delay_max: float = Field(default=300, ge=0, description="Maximum reconnect delay in seconds")
+    model_config = ConfigDict(frozen=True)
+
+    timeout: PositiveInt = 3  # Request timeout in seconds
+    retries: NonNegativeInt = 3  # Max retries per request
+    reconnect_delay: NonNegativeFloat = 0  # Minimum reconnect delay in seconds
+    reconnect_delay_max: NonNegativeFloat = 300  # Maximum reconnect delay in seconds
     
     @model_validator(mode='after')
     def validate_reconnect_delays(self) -> 'ModbusConfig':
@@ -80,34 +126,26 @@ class ModbusConfig(BaseModel):
 class EntityFilterConfig(BaseModel):
     """Entity filtering configuration."""
 
-    mi_entities: List[str] = Field(
-        default=[
-            'grid_voltage',
-            'grid_frequency',
-            'temperature',
-            'operating_status',
-            'alarm_code',
-            'alarm_count',
-            'link_status',
-        ],
-        description="Microinverter entities to publish",
-    )
-    port_entities: List[str] = Field(
-        default=['pv_voltage', 'pv_current', 'pv_power', 'today_production', 'total_production'],
-        description="Port/panel entities to publish",
-    )
-    exclude_inverters: List[str] = Field(default=[], description="Inverter serial numbers to exclude")
-    value_multipliers: Dict[str, float] = Field(default={}, description="Value multipliers for entities")
-    entity_friendly_names: Dict[str, str] = Field(default={}, description="Custom friendly names for entities")
+    model_config = ConfigDict(frozen=True)
+
+    mi_entities: Tuple[str, ...] = MI_ENTITIES  # Microinverter entities to publish
+    port_entities: Tuple[str, ...] = PORT_ENTITIES  # Port/panel entities to publish
+    exclude_inverters: FrozenSet[str] = frozenset()  # Inverter serial numbers to exclude
+    # Value multipliers for entities
+    value_multipliers: Mapping[str, float] = Field(default_factory=lambda: _EMPTY_MAPPING)
+    # Custom friendly names for entities
+    entity_friendly_names: Mapping[str, str] = Field(default_factory=lambda: _EMPTY_MAPPING)
 
 
 class TimingConfig(BaseModel):
     """Timing and scheduling configuration."""
 
-    query_period: int = Field(default=60, ge=5, description="Query period in seconds")
-    expire_after: int = Field(default=0, ge=0, description="Entity expiration time in seconds (0 = never)")
-    reset_hour: int = Field(default=23, ge=0, le=23, description="Hour to reset daily production (0-23)")
-    timezone: str = Field(default="UTC", description="Timezone for scheduling (e.g., 'America/New_York')")
+    model_config = ConfigDict(frozen=True)
+
+    query_period: int = Field(default=60, ge=5)  # Query period in seconds
+    expire_after: NonNegativeInt = 0  # Entity expiration time in seconds (0 = never)
+    reset_hour: Hour = 23  # Hour to reset daily production (0-23)
+    timezone: str = "UTC"  # Timezone for scheduling (e.g., 'America/New_York')
     
     @model_validator(mode='after')
     def validate_expire_after(self) -> 'TimingConfig':
@@ -120,26 +158,32 @@ class TimingConfig(BaseModel):
 class PersistenceConfig(BaseModel):
     """Data persistence configuration."""
 
-    enabled: bool = Field(default=True, description="Enable data persistence")
+    model_config = ConfigDict(frozen=True)
+
+    enabled: bool = True  # Enable data persistence
 
 
 class HealthConfig(BaseModel):
     """Health check configuration."""
 
-    enabled: bool = Field(default=True, description="Enable health check endpoint")
-    host: str = Field(default="0.0.0.0", description="Health check server host")
-    port: int = Field(default=8080, ge=1, le=65535, description="Health check server port")
-    metrics_enabled: bool = Field(default=True, description="Enable Prometheus metrics")
+    model_config = ConfigDict(frozen=True)
+
+    enabled: bool = True  # Enable health check endpoint
+    host: str = "0.0.0.0"  # Health check server host
+    port: Port = 8080  # Health check server port
+    metrics_enabled: bool = True  # Enable Prometheus metrics
 
 
 class InfluxDBConfig(BaseModel):
     """InfluxDB v3 configuration."""
 
-    enabled: bool = Field(default=False, description="Enable InfluxDB v3 integration")
-    host: str = Field(default="", description="InfluxDB host URL (e.g., https://influxdb3.example.com)")
-    token: str = Field(default="", description="InfluxDB API token")
-    database: str = Field(default="hoymiles", description="InfluxDB database/bucket name")
-    org: Optional[str] = Field(default=None, description="InfluxDB organization (optional for v3)")
+    model_config = ConfigDict(frozen=True)
+
+    enabled: bool = False  # Enable InfluxDB v3 integration
+    host: str = ""  # InfluxDB host URL (e.g., https://influxdb3.example.com)
+    token: str = ""  # InfluxDB API token
+    database: str = "hoymiles"  # InfluxDB database/bucket name
+    org: Optional[str] = None  # InfluxDB organization (optional for v3)
     
     @field_validator('host')
     @classmethod
@@ -154,42 +198,42 @@ class InfluxDBConfig(BaseModel):
 class AlertsConfig(BaseModel):
     """Alerting configuration."""
 
-    enabled: bool = Field(default=False, description="Enable alerts")
-    dtu_offline_threshold: int = Field(default=300, ge=60, description="DTU offline threshold in seconds")
-    temperature_threshold: float = Field(default=80.0, ge=0, description="Temperature warning threshold in Celsius")
-    production_drop_threshold: float = Field(
-        default=0.5, ge=0, le=1, description="Production drop threshold (0-1 ratio)"
-    )
+    model_config = ConfigDict(frozen=True)
+
+    enabled: bool = False  # Enable alerts
+    dtu_offline_threshold: int = Field(default=300, ge=60)  # DTU offline threshold in seconds
+    temperature_threshold: NonNegativeFloat = 80.0  # Temperature warning threshold in Celsius
+    production_drop_threshold: float = Field(default=0.5, ge=0, le=1)  # Production drop threshold (0-1 ratio)
 
 
 class LoggingConfig(BaseModel):
     """Logging configuration."""
 
-    level: str = Field(default="WARNING", description="Log level")
-    format: str = Field(default="standard", description="Log format: standard or json")
-    file: Optional[Path] = Field(default=None, description="Log file path")
-    console: bool = Field(default=False, description="Log to console")
-    max_bytes: int = Field(default=10485760, ge=1024, description="Max log file size in bytes")
-    backup_count: int = Field(default=5, ge=0, description="Number of log file backups")
+    model_config = ConfigDict(frozen=True)
+
+    level: Literal['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'] = "WARNING"  # Log level
+    format: str = "standard"  # Log format: standard or json
+    file: Optional[Path] = None  # Log file path
+    console: bool = False  # Log to console
+    max_bytes: int = Field(default=10485760, ge=1024)  # Max log file size in bytes
+    backup_count: NonNegativeInt = 5  # Number of log file backups
     
-    @field_validator('level')
+    @field_validator('level', mode='before')
     @classmethod
-    def validate_level(cls, v: str) -> str:
-        """Validate log level."""
-        valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-        v_upper = v.upper()
-        if v_upper not in valid_levels:
-            raise ValueError(f"Log level must be one of {valid_levels}")
-        return v_upper
+    def validate_level(cls, v: Any) -> Any:
+        """Normalize log level case; the Literal type checks the value."""
+        return v.upper() if isinstance(v, str) else v
 
 
 class ErrorRecoveryConfig(BaseModel):
     """Error recovery configuration."""
 
-    exponential_backoff: bool = Field(default=True, description="Use exponential backoff for retries")
-    max_backoff: int = Field(default=300, ge=1, description="Maximum backoff time in seconds")
-    circuit_breaker_threshold: int = Field(default=5, ge=1, description="Failures before circuit breaker opens")
-    circuit_breaker_timeout: int = Field(default=60, ge=1, description="Circuit breaker timeout in seconds")
+    model_config = ConfigDict(frozen=True)
+
+    exponential_backoff: bool = True  # Use exponential backoff for retries
+    max_backoff: PositiveInt = 300  # Maximum backoff time in seconds
+    circuit_breaker_threshold: PositiveInt = 5  # Failures before circuit breaker opens
+    circuit_breaker_timeout: PositiveInt = 60  # Circuit breaker timeout in seconds
 
 
 class AppConfig(BaseSettings):
@@ -202,80 +246,107 @@ class AppConfig(BaseSettings):
         extra='ignore',
     )
 
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: Type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> Tuple[PydanticBaseSettingsSource, ...]:
+        """Read only init kwargs and environment variables.
+
+        No env_file or secrets_dir is configured, so the dotenv and secrets
+        sources would only walk every field to find nothing.
+        """
+        return init_settings, env_settings
+
     # Configuration file
-    config_file: Optional[Path] = Field(default=None, description="Configuration file path")
+    config_file: Optional[Path] = None  # Configuration file path
     
     # DTU configuration - support for multiple DTUs
-    dtu_host: Optional[str] = Field(default=None, description="Single DTU host (legacy)")
-    dtu_port: int = Field(default=502, description="Single DTU port (legacy)")
-    dtu_configs: List[DtuConfig] = Field(default=[], description="Multiple DTU configurations")
+    dtu_host: Optional[str] = None  # Single DTU host (legacy)
+    dtu_port: int = 502  # Single DTU port (legacy)
+    dtu_configs: List[DtuConfig] = []  # Multiple DTU configurations
     
     # Database configuration
-    db_type: str = Field(default="postgres", description="Database type")
-    db_host: str = Field(default="localhost", description="Database host")
-    db_port: int = Field(default=5432, description="Database port")
-    db_name: str = Field(default="hoymiles", description="Database name")
-    db_user: str = Field(default="hoymiles", description="Database user")
-    db_password: str = Field(default="", description="Database password")
-    db_pool_size: int = Field(default=10, description="Database connection pool size")
-    db_max_overflow: int = Field(default=20, description="Database max overflow")
+    db_type: str = "postgres"  # Database type
+    db_host: str = "localhost"  # Database host
+    db_port: int = 5432  # Database port
+    db_name: str = "hoymiles"  # Database name
+    db_user: str = "hoymiles"  # Database user
+    db_password: str = ""  # Database password
+    db_pool_size: int = 10  # Database connection pool size
+    db_max_overflow: int = 20  # Database max overflow
     
     # Modbus configuration
-    modbus_unit_id: int = Field(default=1, description="Modbus unit ID")
-    comm_timeout: int = Field(default=3, description="Modbus timeout")
-    comm_retries: int = Field(default=3, description="Modbus retries")
-    comm_reconnect_delay: float = Field(default=0, description="Modbus reconnect delay")
-    comm_reconnect_delay_max: float = Field(default=300, description="Modbus max reconnect delay")
+    modbus_unit_id: int = 1  # Modbus unit ID
+    comm_timeout: int = 3  # Modbus timeout
+    comm_retries: int = 3  # Modbus retries
+    comm_reconnect_delay: float = 0  # Modbus reconnect delay
+    comm_reconnect_delay_max: float = 300  # Modbus max reconnect delay
     
     # Entity filtering
-    mi_entities: Optional[List[str]] = Field(default=None, description="Microinverter entities")
-    port_entities: Optional[List[str]] = Field(default=None, description="Port entities")
-    exclude_inverters: List[str] = Field(default=[], description="Exclude inverter serial numbers")
-    value_multipliers: Dict[str, float] = Field(default={}, description="Value multipliers")
-    entity_friendly_names: Dict[str, str] = Field(default={}, description="Entity friendly names")
+    mi_entities: Optional[List[str]] = None  # Microinverter entities
+    port_entities: Optional[List[str]] = None  # Port entities
+    exclude_inverters: List[str] = []  # Exclude inverter serial numbers
+    value_multipliers: Dict[str, float] = {}  # Value multipliers
+    entity_friendly_names: Dict[str, str] = {}  # Entity friendly names
     
     # Timing
-    query_period: int = Field(default=60, description="Query period in seconds")
-    expire_after: int = Field(default=0, description="Entity expiration time")
-    reset_hour: int = Field(default=23, description="Daily reset hour")
-    timezone: str = Field(default="UTC", description="Timezone")
+    query_period: int = 60  # Query period in seconds
+    expire_after: int = 0  # Entity expiration time
+    reset_hour: int = 23  # Daily reset hour
+    timezone: str = "UTC"  # Timezone
     
     # Persistence
-    persistence_enabled: bool = Field(default=True, description="Enable persistence")
+    persistence_enabled: bool = True  # Enable persistence
     
     # Health check
-    health_enabled: bool = Field(default=True, description="Enable health check")
-    health_host: str = Field(default="0.0.0.0", description="Health check host")
-    health_port: int = Field(default=8080, description="Health check port")
-    metrics_enabled: bool = Field(default=True, description="Enable metrics")
+    health_enabled: bool = True  # Enable health check
+    health_host: str = "0.0.0.0"  # Health check host
+    health_port: int = 8080  # Health check port
+    metrics_enabled: bool = True  # Enable metrics
     
     # Alerts
-    alerts_enabled: bool = Field(default=False, description="Enable alerts")
-    dtu_offline_threshold: int = Field(default=300, description="DTU offline threshold")
-    temperature_threshold: float = Field(default=80.0, description="Temperature threshold")
+    alerts_enabled: bool = False  # Enable alerts
+    dtu_offline_threshold: int = 300  # DTU offline threshold
+    temperature_threshold: float = 80.0  # Temperature threshold
     
     # Logging
-    log_level: str = Field(default="WARNING", description="Log level")
-    log_format: str = Field(default="standard", description="Log format")
-    log_file: Optional[str] = Field(default=None, description="Log file path")
-    log_to_console: bool = Field(default=False, description="Log to console")
+    log_level: str = "WARNING"  # Log level
+    log_format: str = "standard"  # Log format
+    log_file: Optional[Path] = None  # Log file path
+    log_to_console: bool = False  # Log to console
     
     # Error recovery
-    exponential_backoff: bool = Field(default=True, description="Use exponential backoff")
-    circuit_breaker_threshold: int = Field(default=5, description="Circuit breaker threshold")
+    exponential_backoff: bool = True  # Use exponential backoff
+    circuit_breaker_threshold: int = 5  # Circuit breaker threshold
     
     # InfluxDB configuration
-    influxdb_enabled: bool = Field(default=False, description="Enable InfluxDB v3")
-    influxdb_host: str = Field(default="", description="InfluxDB host URL")
-    influxdb_token: str = Field(default="", description="InfluxDB API token")
-    influxdb_database: str = Field(default="hoymiles", description="InfluxDB database name")
-    influxdb_org: Optional[str] = Field(default=None, description="InfluxDB organization")
+    influxdb_enabled: bool = False  # Enable InfluxDB v3
+    influxdb_host: str = ""  # InfluxDB host URL
+    influxdb_token: str = ""  # InfluxDB API token
+    influxdb_database: str = "hoymiles"  # InfluxDB database name
+    influxdb_org: Optional[str] = None  # InfluxDB organization
     
     # Advanced options
-    dry_run: bool = Field(default=False, description="Dry run mode (no publishing)")
-    dump_data: bool = Field(default=False, description="Dump raw data to file")
-    dump_data_path: Optional[Path] = Field(default=None, description="Data dump file path")
+    dry_run: bool = False  # Dry run mode (no publishing)
+    dump_data: bool = False  # Dump raw data to file
+    dump_data_path: Optional[Path] = None  # Data dump file path
 
+    # Sub-config objects built by the get_*() methods
+    _sub_configs: Dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set a field, invalidating the cached get_*_config() objects."""
+        super().__setattr__(name, value)
+        if not name.startswith('_'):
+            # A new dict rather than clear(): a model_copy() may still share it
+            self._sub_configs = {}
+
+    @_cached_sub_config
     def get_database_config(self) -> DatabaseConfig:
         """Get database configuration object."""
         return DatabaseConfig(
@@ -289,6 +360,7 @@ class AppConfig(BaseSettings):
             max_overflow=self.db_max_overflow,
         )
     
+    @_cached_sub_config
     def get_dtu_configs(self) -> List[DtuConfig]:
         """Get list of DTU configurations."""
         if self.dtu_configs:
@@ -299,6 +371,7 @@ class AppConfig(BaseSettings):
         else:
             raise ValueError("At least one DTU must be configured (dtu_host or dtu_configs)")
     
+    @_cached_sub_config
     def get_modbus_config(self) -> ModbusConfig:
         """Get Modbus configuration object."""
         return ModbusConfig(
@@ -308,30 +381,18 @@ class AppConfig(BaseSettings):
             reconnect_delay_max=self.comm_reconnect_delay_max,
         )
     
+    @_cached_sub_config
     def get_entity_filter_config(self) -> EntityFilterConfig:
         """Get entity filter configuration."""
         return EntityFilterConfig(
-            mi_entities=self.mi_entities or [
-                'grid_voltage',
-                'grid_frequency',
-                'temperature',
-                'operating_status',
-                'alarm_code',
-                'alarm_count',
-                'link_status',
-            ],
-            port_entities=self.port_entities or [
-                'pv_voltage',
-                'pv_current',
-                'pv_power',
-                'today_production',
-                'total_production',
-            ],
+            mi_entities=self.mi_entities or MI_ENTITIES,
+            port_entities=self.port_entities or PORT_ENTITIES,
             exclude_inverters=self.exclude_inverters,
             value_multipliers=self.value_multipliers,
             entity_friendly_names=self.entity_friendly_names,
         )
     
+    @_cached_sub_config
     def get_timing_config(self) -> TimingConfig:
         """Get timing configuration."""
         return TimingConfig(
@@ -341,12 +402,14 @@ class AppConfig(BaseSettings):
             timezone=self.timezone,
         )
     
+    @_cached_sub_config
     def get_persistence_config(self) -> PersistenceConfig:
         """Get persistence configuration."""
         return PersistenceConfig(
             enabled=self.persistence_enabled,
         )
     
+    @_cached_sub_config
     def get_health_config(self) -> HealthConfig:
         """Get health check configuration."""
         return HealthConfig(
@@ -356,15 +419,17 @@ class AppConfig(BaseSettings):
             metrics_enabled=self.metrics_enabled,
         )
     
+    @_cached_sub_config
     def get_logging_config(self) -> LoggingConfig:
         """Get logging configuration."""
         return LoggingConfig(
             level=self.log_level,
             format=self.log_format,
-            file=Path(self.log_file) if self.log_file else None,
+            file=self.log_file,
             console=self.log_to_console,
         )
     
+    @_cached_sub_config
     def get_influxdb_config(self) -> InfluxDBConfig:
         """Get InfluxDB configuration."""
         return InfluxDBConfig(
@@ -375,6 +440,12 @@ class AppConfig(BaseSettings):
             org=self.influxdb_org,
         )
 
+    @field_validator('log_file', mode='before')
+    @classmethod
+    def validate_log_file(cls, v: Any) -> Any:
+        """Treat an empty log file path (e.g. LOG_FILE=) as unset."""
+        return v or None
+
     @model_validator(mode='after')
     def validate_config(self) -> 'AppConfig':
         """Validate complete configuration."""
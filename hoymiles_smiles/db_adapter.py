@@ -2,7 +2,7 @@
 
 import json
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -34,13 +34,17 @@ class DatabaseAdapter:
         """
         self.db_type = db_type.lower()
         
-    def create_pool(self, config: Dict[str, Any], pool_size: int, max_overflow: int):
+    def create_pool(self, config: Dict[str, Any], pool_size: int, max_overflow: int,
+                    synchronous_commit: Optional[str] = None, min_size: int = 1):
         """Create database connection pool.
         
         Args:
             config: Database configuration
-            pool_size: Minimum pool size
+            pool_size: Pool size
             max_overflow: Maximum pool overflow
+            synchronous_commit: PostgreSQL synchronous_commit setting for pooled
+                connections (None keeps the server default)
+            min_size: PostgreSQL connections opened at startup and kept open
             
         Returns:
             Connection pool object
@@ -48,8 +52,14 @@ class DatabaseAdapter:
         if self.db_type in ['postgres', 'postgresql']:
             if not HAS_POSTGRES:
                 raise ImportError("psycopg2 not installed for PostgreSQL support")
-            return pg_pool.SimpleConnectionPool(
-                minconn=1,
+            if synchronous_commit:
+                # Set per session at connect time so no extra round trip is needed
+                config = {**config, 'options': f'-c synchronous_commit={synchronous_commit}'}
+            # Threaded pool: the poller and health server threads share it.
+            # psycopg2 closes returned connections above minconn, so raising
+            # min_size avoids reconnecting when several DTUs poll at once.
+            return pg_pool.ThreadedConnectionPool(
+                minconn=min_size,
                 maxconn=pool_size + max_overflow,
                 **config
             )
@@ -107,6 +117,23 @@ class DatabaseAdapter:
         else:  # MySQL
             return conn.cursor(dictionary=dict_cursor)
     
+    def execute_script(self, cursor, statements: List[str]) -> None:
+        """Execute several DDL statements with as few round trips as possible.
+        
+        PostgreSQL accepts multiple statements in one execute, so they are
+        sent as a single batch. MySQL Connector does not by default, so
+        statements are executed one by one.
+        
+        Args:
+            cursor: Database cursor
+            statements: SQL statements to execute in order
+        """
+        if self.db_type in ['postgres', 'postgresql']:
+            cursor.execute(';\n'.join(statements))
+        else:  # MySQL
+            for statement in statements:
+                cursor.execute(statement)
+    
     def get_schema_sql(self) -> Dict[str, str]:
         """Get schema creation SQL for the database type.
         
@@ -1,18 +1,48 @@
 """Health check HTTP server with Prometheus metrics."""
 
+import gzip
 import json
 import logging
 import threading
 import time
 from datetime import datetime, timezone
-from http.server import BaseHTTPRequestHandler, HTTPServer
-from typing import Any, Dict, Optional
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
 
 from prometheus_client import Counter, Gauge, Histogram, generate_latest, CONTENT_TYPE_LATEST
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _json_bytes(data: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize data to compact JSON bytes.
+    
+    Responses go to probes, dashboards and the Home Assistant integration, so
+    no indentation is emitted. Uses orjson when it is installed, with options
+    matching json.dumps: datetimes and other unsupported types go through
+    default, and non-string dict keys are allowed.
+    
+    Args:
+        data: Data to serialize
+        default: Serializer for types JSON does not support
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+    return json.dumps(data, separators=(',', ':'), default=default).encode()
+
+
 # Prometheus metrics
 QUERY_TOTAL = Counter('hoymiles_queries_total', 'Total number of DTU queries', ['dtu_name', 'status'])
 QUERY_DURATION = Histogram('hoymiles_query_duration_seconds', 'DTU query duration', ['dtu_name'])
@@ -27,6 +57,62 @@ TOTAL_PRODUCTION = Gauge('hoymiles_total_production_wh', 'Total lifetime product
 UPTIME = Gauge('hoymiles_smiles_uptime_seconds', 'Application uptime')
 CIRCUIT_BREAKER_STATE = Gauge('hoymiles_circuit_breaker_state', 'Circuit breaker state (0=closed, 1=open)', ['dtu_name'])
 
+# Serialized /metrics output is reused for this long, so concurrent or
+# closely spaced scrapes share one collection
+METRICS_CACHE_TTL = 1.0
+
+# (generated at, raw output, gzip-compressed output)
+_metrics_cache: Tuple[float, bytes, bytes] = (float('-inf'), b'', b'')
+_metrics_cache_lock = threading.Lock()
+
+
+def _get_metrics_output(compressed: bool = False) -> bytes:
+    """Get the Prometheus exposition output, regenerated at most once per TTL.
+    
+    The gzip form is compressed once per regeneration, so scrapers that
+    accept gzip get a smaller response at no extra cost per scrape.
+    
+    Args:
+        compressed: Return the gzip-compressed output
+        
+    Returns:
+        Exposition output
+    """
+    global _metrics_cache
+    with _metrics_cache_lock:
+        generated_at, output, gzipped = _metrics_cache
+        now = time.monotonic()
+        if now - generated_at >= METRICS_CACHE_TTL:
+            output = generate_latest()
+            gzipped = gzip.compress(output, compresslevel=1)
+            _metrics_cache = (now, output, gzipped)
+        return gzipped if compressed else output
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Check whether an Accept-Encoding header allows a gzip response.
+    
+    Args:
+        accept_encoding: Accept-Encoding header value
+        
+    Returns:
+        True if gzip (or *) is listed without q=0
+    """
+    for part in accept_encoding.split(','):
+        coding, *params = [item.strip() for item in part.split(';')]
+        if coding.lower() not in ('gzip', '*'):
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        return quality > 0
+    return False
+
 
 class HealthMetrics:
     """Application health metrics."""
@@ -40,7 +126,56 @@ class HealthMetrics:
         self.query_count: Dict[str, int] = {}
         self.error_count: Dict[str, int] = {}
         self.dtu_status: Dict[str, str] = {}
+        # ISO-8601 forms of the timestamps above, formatted once when recorded
+        self._last_successful_query_iso: Dict[str, str] = {}
+        self._last_error_time_iso: Dict[str, str] = {}
+        self._start_time_iso = datetime.fromtimestamp(self.start_time).isoformat()
         self._lock = threading.Lock()
+        # Bumped on every change to the per-DTU state above; get_health_status
+        # rebuilds its per-DTU snapshot only when this has moved on
+        self._version = 0
+        self._snapshot: Tuple[int, Dict[str, Tuple[Optional[float], Dict[str, Any]]]] = (-1, {})
+        # Bound Prometheus children keyed by (metric, label values)
+        self._metric_children: Dict[Tuple[Any, Tuple[Any, ...]], Any] = {}
+    
+    def _labels(self, metric: Any, *values: Any) -> Any:
+        """Get the metric child for the given label values.
+        
+        Equivalent to metric.labels(*values), but the child is looked up in
+        prometheus_client only once per label combination.
+        
+        Args:
+            metric: Prometheus metric with labels
+            *values: Label values in the metric's label order
+            
+        Returns:
+            Metric child
+        """
+        key = (metric, values)
+        child = self._metric_children.get(key)
+        if child is None:
+            child = self._metric_children[key] = metric.labels(*values)
+        return child
+    
+    def warm(self, dtu_names: Iterable[str]) -> None:
+        """Bind the per-DTU metric children up front.
+        
+        The configured DTUs are known at startup, so their children are
+        created once here instead of on the first query. This also makes every
+        DTU series appear in /metrics from the first scrape.
+        
+        Args:
+            dtu_names: Names of the configured DTUs
+        """
+        for dtu_name in dtu_names:
+            self._labels(QUERY_TOTAL, dtu_name, 'success')
+            self._labels(QUERY_TOTAL, dtu_name, 'error')
+            self._labels(QUERY_DURATION, dtu_name)
+            self._labels(DTU_AVAILABLE, dtu_name)
+            self._labels(DTU_POWER, dtu_name)
+            self._labels(TODAY_PRODUCTION, dtu_name)
+            self._labels(TOTAL_PRODUCTION, dtu_name)
+            self._labels(CIRCUIT_BREAKER_STATE, dtu_name)
     
     def record_query_success(self, dtu_name: str, duration: float) -> None:
         """Record successful query.
@@ -49,14 +184,20 @@ class HealthMetrics:
             dtu_name: DTU name
             duration: Query duration in seconds
         """
+        now = time.time()
+        now_iso = datetime.fromtimestamp(now, tz=timezone.utc).isoformat()
         with self._lock:
-            self.last_successful_query[dtu_name] = time.time()
+            self.last_successful_query[dtu_name] = now
+            self._last_successful_query_iso[dtu_name] = now_iso
             self.query_count[dtu_name] = self.query_count.get(dtu_name, 0) + 1
             self.dtu_status[dtu_name] = 'online'
-            
-            QUERY_TOTAL.labels(dtu_name=dtu_name, status='success').inc()
-            QUERY_DURATION.labels(dtu_name=dtu_name).observe(duration)
-            DTU_AVAILABLE.labels(dtu_name=dtu_name).set(1)
+            self._version += 1
+        
+        # Prometheus metrics are thread-safe on their own, so update them
+        # outside our lock to keep the critical section to the dict updates
+        self._labels(QUERY_TOTAL, dtu_name, 'success').inc()
+        self._labels(QUERY_DURATION, dtu_name).observe(duration)
+        self._labels(DTU_AVAILABLE, dtu_name).set(1)
     
     def record_query_error(self, dtu_name: str, error_type: str, error_msg: str) -> None:
         """Record query error.
@@ -66,15 +207,19 @@ class HealthMetrics:
             error_type: Type of error
             error_msg: Error message
         """
+        now = time.time()
+        now_iso = datetime.fromtimestamp(now, tz=timezone.utc).isoformat()
         with self._lock:
             self.last_error[dtu_name] = error_msg
-            self.last_error_time[dtu_name] = time.time()
+            self.last_error_time[dtu_name] = now
+            self._last_error_time_iso[dtu_name] = now_iso
             self.error_count[dtu_name] = self.error_count.get(dtu_name, 0) + 1
             self.dtu_status[dtu_name] = 'error'
-            
-            QUERY_TOTAL.labels(dtu_name=dtu_name, status='error').inc()
-            QUERY_ERRORS.labels(dtu_name=dtu_name, error_type=error_type).inc()
-            DTU_AVAILABLE.labels(dtu_name=dtu_name).set(0)
+            self._version += 1
+        
+        self._labels(QUERY_TOTAL, dtu_name, 'error').inc()
+        self._labels(QUERY_ERRORS, dtu_name, error_type).inc()
+        self._labels(DTU_AVAILABLE, dtu_name).set(0)
     
     def update_inverter_metrics(self, serial_number: str, port: Optional[int], 
                                power: Optional[float], temperature: Optional[float],
@@ -89,13 +234,13 @@ class HealthMetrics:
             status: Operating status
         """
         if power is not None and port is not None:
-            INVERTER_POWER.labels(serial_number=serial_number, port=str(port)).set(power)
+            self._labels(INVERTER_POWER, serial_number, port).set(power)
         
         if temperature is not None:
-            INVERTER_TEMPERATURE.labels(serial_number=serial_number).set(temperature)
+            self._labels(INVERTER_TEMPERATURE, serial_number).set(temperature)
         
         if status is not None:
-            INVERTER_STATUS.labels(serial_number=serial_number).set(status)
+            self._labels(INVERTER_STATUS, serial_number).set(status)
     
     def update_dtu_metrics(self, dtu_name: str, power: float, 
                           today_production: int, total_production: int) -> None:
@@ -107,9 +252,9 @@ class HealthMetrics:
             today_production: Today's production
             total_production: Total production
         """
-        DTU_POWER.labels(dtu_name=dtu_name).set(power)
-        TODAY_PRODUCTION.labels(dtu_name=dtu_name).set(today_production)
-        TOTAL_PRODUCTION.labels(dtu_name=dtu_name).set(total_production)
+        self._labels(DTU_POWER, dtu_name).set(power)
+        self._labels(TODAY_PRODUCTION, dtu_name).set(today_production)
+        self._labels(TOTAL_PRODUCTION, dtu_name).set(total_production)
     
     def update_circuit_breaker_state(self, dtu_name: str, is_open: bool) -> None:
         """Update circuit breaker state.
@@ -118,7 +263,7 @@ class HealthMetrics:
             dtu_name: DTU name
             is_open: Whether circuit breaker is open
         """
-        CIRCUIT_BREAKER_STATE.labels(dtu_name=dtu_name).set(1 if is_open else 0)
+        self._labels(CIRCUIT_BREAKER_STATE, dtu_name).set(1 if is_open else 0)
     
     def get_uptime(self) -> float:
         """Get application uptime in seconds."""
@@ -148,46 +293,56 @@ class HealthMetrics:
             
             return False
     
+    def _build_snapshot(self) -> Dict[str, Tuple[Optional[float], Dict[str, Any]]]:
+        """Build the per-DTU part of the health status.
+        
+        Must be called with the lock held. The time-dependent
+        seconds_since_last_success is left as None and filled in per call.
+        
+        Returns:
+            Mapping of DTU name to (last success time, status entry)
+        """
+        snapshot = {}
+        for dtu_name in self.last_successful_query.keys() | self.last_error.keys():
+            snapshot[dtu_name] = (self.last_successful_query.get(dtu_name), {
+                'status': self.dtu_status.get(dtu_name, 'unknown'),
+                'last_successful_query': self._last_successful_query_iso.get(dtu_name),
+                'seconds_since_last_success': None,
+                'query_count': self.query_count.get(dtu_name, 0),
+                'error_count': self.error_count.get(dtu_name, 0),
+                'last_error': self.last_error.get(dtu_name),
+                'last_error_time': self._last_error_time_iso.get(dtu_name),
+            })
+        return snapshot
+    
     def get_health_status(self) -> Dict[str, Any]:
         """Get comprehensive health status.
         
         Returns:
             Health status dictionary
         """
-        # Copy data quickly while holding lock
         with self._lock:
             current_time = time.time()
-            last_successful_query = self.last_successful_query.copy()
-            last_error = self.last_error.copy()
-            last_error_time = self.last_error_time.copy()
-            query_count = self.query_count.copy()
-            error_count = self.error_count.copy()
-            dtu_status = self.dtu_status.copy()
+            version, snapshot = self._snapshot
+            if version != self._version:
+                snapshot = self._build_snapshot()
+                self._snapshot = (self._version, snapshot)
         
         # Build response outside lock
         uptime = self.get_uptime()
         
         dtu_statuses = {}
-        for dtu_name in set(list(last_successful_query.keys()) + list(last_error.keys())):
-            last_success = last_successful_query.get(dtu_name)
-            error_msg = last_error.get(dtu_name)
-            error_time = last_error_time.get(dtu_name)
-            
+        for dtu_name, (last_success, entry) in snapshot.items():
             dtu_statuses[dtu_name] = {
-                'status': dtu_status.get(dtu_name, 'unknown'),
-                'last_successful_query': datetime.fromtimestamp(last_success, tz=timezone.utc).isoformat() if last_success else None,
+                **entry,
                 'seconds_since_last_success': int(current_time - last_success) if last_success else None,
-                'query_count': query_count.get(dtu_name, 0),
-                'error_count': error_count.get(dtu_name, 0),
-                'last_error': error_msg,
-                'last_error_time': datetime.fromtimestamp(error_time, tz=timezone.utc).isoformat() if error_time else None,
             }
         
-        # Return status built from copied data
+        # Return status built from the snapshot
         return {
             'healthy': self.is_healthy(),
             'uptime_seconds': int(uptime),
-            'start_time': datetime.fromtimestamp(self.start_time).isoformat(),
+            'start_time': self._start_time_iso,
             'dtus': dtu_statuses,
         }
 
@@ -199,8 +354,20 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
     persistence_manager: Optional[Any] = None
     websocket_client: Optional[Any] = None
     
+    # Fixed GET paths mapped to their handler method names
+    _GET_ROUTES = {
+        '/ready': '_handle_ready',
+        '/health': '_handle_health',
+        '/metrics': '_handle_metrics',
+        '/stats': '_handle_stats',
+        '/bundle': '_handle_bundle',
+    }
+    
     def log_message(self, format: str, *args) -> None:
         """Override to use Python logging."""
+        # Called for every request (probes included); skip formatting unless shown
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         try:
             logger.debug(f"{self.address_string()} - {format % args}")
         except Exception:
@@ -209,19 +376,12 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
     def do_GET(self) -> None:
         """Handle GET requests."""
         try:
-            # Log API requests (but not health checks to avoid spam)
-            if self.path.startswith('/api/'):
-                logger.info(f"[API Request] GET {self.path} from {self.client_address[0]}")
-            
-            if self.path == '/health':
-                self._handle_health()
-            elif self.path == '/ready':
-                self._handle_ready()
-            elif self.path == '/metrics':
-                self._handle_metrics()
-            elif self.path == '/stats':
-                self._handle_stats()
+            route = self._GET_ROUTES.get(self.path)
+            if route is not None:
+                getattr(self, route)()
             elif self.path.startswith('/api/'):
+                # Log API requests (but not health checks to avoid spam)
+                logger.info(f"[API Request] GET {self.path} from {self.client_address[0]}")
                 self._handle_api()
             else:
                 self.send_error(404, "Not Found")
@@ -253,7 +413,7 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
             self.send_response(200 if status['healthy'] else 503)
             self.send_header('Content-type', 'application/json')
             self.end_headers()
-            self.wfile.write(json.dumps(status, indent=2).encode())
+            self.wfile.write(_json_bytes(status))
         else:
             self.send_error(503, "Health metrics not available")
     
@@ -269,10 +429,16 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
     
     def _handle_metrics(self) -> None:
         """Handle /metrics endpoint (Prometheus)."""
+        use_gzip = _accepts_gzip(self.headers.get('Accept-Encoding', ''))
+        output = _get_metrics_output(compressed=use_gzip)
         self.send_response(200)
         self.send_header('Content-type', CONTENT_TYPE_LATEST)
+        self.send_header('Vary', 'Accept-Encoding')
+        if use_gzip:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(output)))
         self.end_headers()
-        self.wfile.write(generate_latest())
+        self.wfile.write(output)
     
     def _handle_stats(self) -> None:
         """Handle /stats endpoint (database statistics)."""
@@ -281,10 +447,27 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
             self.send_response(200)
             self.send_header('Content-type', 'application/json')
             self.end_headers()
-            self.wfile.write(json.dumps(stats, indent=2).encode())
+            self.wfile.write(_json_bytes(stats))
         else:
             self.send_error(503, "Persistence manager not available")
     
+    def _handle_bundle(self) -> None:
+        """Handle /bundle endpoint (health, stats and inverters in one response)."""
+        if not self.health_metrics:
+            self.send_error(503, "Health metrics not available")
+            return
+        
+        status = self.health_metrics.get_health_status()
+        bundle = {
+            'health': status,
+            'stats': self.persistence_manager.get_statistics() if self.persistence_manager else {},
+            'inverters': self.persistence_manager.get_all_inverters_with_data() if self.persistence_manager else [],
+        }
+        self.send_response(200 if status['healthy'] else 503)
+        self.send_header('Content-type', 'application/json')
+        self.end_headers()
+        self.wfile.write(_json_bytes(bundle, default=str))
+    
     def _handle_api(self) -> None:
         """Handle API endpoints for sensor data."""
         if not self.persistence_manager:
@@ -428,7 +611,39 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
         self.send_header('Content-type', 'application/json')
         self.send_header('Access-Control-Allow-Origin', '*')  # Allow CORS for Home Assistant
         self.end_headers()
-        self.wfile.write(json.dumps(data, indent=2, default=default).encode())
+        self.wfile.write(_json_bytes(data, default=default))
+
+
+class BoundedThreadingHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server that caps the number of concurrent handlers.
+    
+    Each request runs on its own daemon thread, so a slow /metrics or /bundle
+    response does not hold up /ready probes. Once max_handlers requests are in
+    flight, accepting new connections waits for one to finish.
+    """
+    
+    max_handlers = 16
+    
+    def __init__(self, *args, **kwargs):
+        """Initialize server and handler slots."""
+        super().__init__(*args, **kwargs)
+        self._handler_slots = threading.BoundedSemaphore(self.max_handlers)
+    
+    def process_request(self, request, client_address) -> None:
+        """Start a handler thread once a slot is free."""
+        self._handler_slots.acquire()
+        try:
+            super().process_request(request, client_address)
+        except Exception:
+            self._handler_slots.release()
+            raise
+    
+    def process_request_thread(self, request, client_address) -> None:
+        """Handle the request and release its slot."""
+        try:
+            super().process_request_thread(request, client_address)
+        finally:
+            self._handler_slots.release()
 
 
 class HealthCheckServer:
@@ -451,7 +666,7 @@ class HealthCheckServer:
         self.health_metrics = health_metrics
         self.persistence_manager = persistence_manager
         self.websocket_client = websocket_client
-        self.server: Optional[HTTPServer] = None
+        self.server: Optional[BoundedThreadingHTTPServer] = None
         self.thread: Optional[threading.Thread] = None
     
     def start(self) -> None:
@@ -462,7 +677,7 @@ class HealthCheckServer:
             HealthCheckHandler.persistence_manager = self.persistence_manager
             HealthCheckHandler.websocket_client = self.websocket_client
             
-            self.server = HTTPServer((self.host, self.port), HealthCheckHandler)
+            self.server = BoundedThreadingHTTPServer((self.host, self.port), HealthCheckHandler)
             
             self.thread = threading.Thread(target=self._run_server, daemon=True)
             self.thread.start()
@@ -472,6 +687,7 @@ class HealthCheckServer:
             logger.info(f"  Ready: http://{self.host}:{self.port}/ready")
             logger.info(f"  Metrics: http://{self.host}:{self.port}/metrics")
             logger.info(f"  Stats: http://{self.host}:{self.port}/stats")
+            logger.info(f"  Bundle: http://{self.host}:{self.port}/bundle")
             logger.info(f"  API: http://{self.host}:{self.port}/api/...")
             
         except Exception as e:
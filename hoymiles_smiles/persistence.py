@@ -68,6 +68,50 @@ def normalize_db_record(record: Dict[str, Any]) -> Dict[str, Any]:
     return normalized
 
 
+INSERT_INVERTER_DATA_SQL = '''
+    INSERT INTO inverter_data 
+    (serial_number, grid_voltage, grid_frequency, temperature, 
+     operating_status, alarm_code, alarm_count, link_status, raw_data)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+'''
+
+INSERT_PORT_DATA_SQL = '''
+    INSERT INTO port_data 
+    (serial_number, port_number, pv_voltage, pv_current, pv_power, 
+     today_production, total_production, raw_data)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+'''
+
+
+def _inverter_data_row(serial_number: str, data: Dict[str, Any]) -> Tuple:
+    """Build INSERT_INVERTER_DATA_SQL parameters for one reading."""
+    return (
+        serial_number,
+        data.get('grid_voltage'),
+        data.get('grid_frequency'),
+        data.get('temperature'),
+        data.get('operating_status'),
+        data.get('alarm_code'),
+        data.get('alarm_count'),
+        data.get('link_status'),
+        json.dumps(data, cls=DecimalEncoder)
+    )
+
+
+def _port_data_row(serial_number: str, port_number: int, data: Dict[str, Any]) -> Tuple:
+    """Build INSERT_PORT_DATA_SQL parameters for one reading."""
+    return (
+        serial_number,
+        port_number,
+        data.get('pv_voltage'),
+        data.get('pv_current'),
+        data.get('pv_power'),
+        data.get('today_production'),
+        data.get('total_production'),
+        json.dumps(data, cls=DecimalEncoder)
+    )
+
+
 class PersistenceManager:
     """Manages persistent storage of solar production data in PostgreSQL or MySQL/MariaDB."""
 
@@ -109,9 +153,17 @@ class PersistenceManager:
             config = self._get_db_config()
             pool_size = int(os.getenv('DB_POOL_SIZE', 10))
             max_overflow = int(os.getenv('DB_MAX_OVERFLOW', 20))
+            min_size = int(os.getenv('DB_POOL_MIN_SIZE', 1))
+            # Opt-in: 'off' lets commits return before the WAL flush, at the risk
+            # of losing the last few commits on a server crash. Unset keeps the
+            # server setting.
+            synchronous_commit = os.getenv('DB_SYNCHRONOUS_COMMIT')
             
             # Create connection pool using adapter
-            self.connection_pool = self.adapter.create_pool(config, pool_size, max_overflow)
+            self.connection_pool = self.adapter.create_pool(
+                config, pool_size, max_overflow,
+                synchronous_commit=synchronous_commit, min_size=min_size,
+            )
             
             logger.info(f"Connected to {self.db_type.upper()} at {config['host']}:{config['port']}/{config['database']}")
             
@@ -146,10 +198,9 @@ class PersistenceManager:
             # Create tables in order (respecting foreign keys)
             table_order = ['inverters', 'inverter_data', 'port_data', 'production_cache', 'config_cache', 'system_metrics']
             
-            for table_name in table_order:
-                if table_name in schema_sql:
-                    cursor.execute(schema_sql[table_name])
-                    logger.debug(f"Created/verified table: {table_name}")
+            tables = [table_name for table_name in table_order if table_name in schema_sql]
+            self.adapter.execute_script(cursor, [schema_sql[table_name] for table_name in tables])
+            logger.debug(f"Created/verified tables: {', '.join(tables)}")
             
             conn.commit()
             logger.info("Database schema created successfully")
@@ -183,22 +234,7 @@ class PersistenceManager:
             cursor.execute(self.adapter.upsert_inverter(), (serial_number, dtu_name))
             
             # Insert inverter data
-            cursor.execute('''
-                INSERT INTO inverter_data 
-                (serial_number, grid_voltage, grid_frequency, temperature, 
-                 operating_status, alarm_code, alarm_count, link_status, raw_data)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ''', (
-                serial_number,
-                data.get('grid_voltage'),
-                data.get('grid_frequency'),
-                data.get('temperature'),
-                data.get('operating_status'),
-                data.get('alarm_code'),
-                data.get('alarm_count'),
-                data.get('link_status'),
-                json.dumps(data, cls=DecimalEncoder)
-            ))
+            cursor.execute(INSERT_INVERTER_DATA_SQL, _inverter_data_row(serial_number, data))
             
             conn.commit()
             logger.debug(f"Saved inverter data for {serial_number}")
@@ -231,21 +267,7 @@ class PersistenceManager:
             cursor.execute(self.adapter.upsert_inverter(), (serial_number, None))
             
             # Insert port data
-            cursor.execute('''
-                INSERT INTO port_data 
-                (serial_number, port_number, pv_voltage, pv_current, pv_power, 
-                 today_production, total_production, raw_data)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            ''', (
-                serial_number,
-                port_number,
-                data.get('pv_voltage'),
-                data.get('pv_current'),
-                data.get('pv_power'),
-                data.get('today_production'),
-                data.get('total_production'),
-                json.dumps(data, cls=DecimalEncoder)
-            ))
+            cursor.execute(INSERT_PORT_DATA_SQL, _port_data_row(serial_number, port_number, data))
             
             conn.commit()
             logger.debug(f"Saved port data for {serial_number} port {port_number}")
@@ -295,6 +317,73 @@ class PersistenceManager:
             if conn:
                 self._return_connection(conn)
     
+    def save_poll_data(self, dtu_name: str, inverter_readings: List[Tuple[str, Dict[str, Any]]],
+                       port_readings: List[Tuple[str, int, Dict[str, Any]]]) -> None:
+        """Save all readings from one DTU poll in a single transaction.
+        
+        Equivalent to calling save_inverter_data, save_port_data and
+        save_production_cache for every reading, but with one commit and one
+        executemany per statement instead of a transaction per row. If the
+        batch fails, the readings are saved one by one so a single bad row
+        does not lose the rest of the poll.
+        
+        Args:
+            dtu_name: DTU name
+            inverter_readings: (serial_number, inverter data) per inverter
+            port_readings: (serial_number, port_number, port data) per port
+        """
+        if not self.enabled or not self.connection_pool:
+            return
+        if not inverter_readings and not port_readings:
+            return
+        
+        conn = None
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            serial_numbers = dict.fromkeys(
+                [serial for serial, _ in inverter_readings] + [serial for serial, _, _ in port_readings]
+            )
+            cursor.executemany(
+                self.adapter.upsert_inverter(), [(serial, dtu_name) for serial in serial_numbers]
+            )
+            if inverter_readings:
+                cursor.executemany(INSERT_INVERTER_DATA_SQL, [
+                    _inverter_data_row(serial, data) for serial, data in inverter_readings
+                ])
+            if port_readings:
+                cursor.executemany(INSERT_PORT_DATA_SQL, [
+                    _port_data_row(serial, port, data) for serial, port, data in port_readings
+                ])
+                cursor.executemany(self.adapter.upsert_production_cache(), [
+                    (serial, port, data.get('today_production'), data.get('total_production'))
+                    for serial, port, data in port_readings
+                ])
+            
+            conn.commit()
+            logger.debug(
+                f"Saved {len(inverter_readings)} inverter and {len(port_readings)} port readings for {dtu_name}"
+            )
+            return
+            
+        except Exception as e:
+            if conn:
+                conn.rollback()
+            logger.warning(f"Batch save of poll data for {dtu_name} failed, saving row by row: {e}")
+        finally:
+            if conn:
+                self._return_connection(conn)
+        
+        # One bad row rolled back the batch; save rows individually so only it is lost
+        for serial, data in inverter_readings:
+            self.save_inverter_data(serial, dtu_name, data)
+        for serial, port, data in port_readings:
+            self.save_port_data(serial, port, data)
+            self.save_production_cache(
+                serial, port, data.get('today_production'), data.get('total_production')
+            )
+    
     def load_production_cache(self) -> Dict[Tuple[str, int], Tuple[int, int]]:
         """Load production cache for all inverter ports.
         
@@ -1,11 +1,14 @@
 """Enhanced runners with multi-DTU support."""
 
+import asyncio
 import logging
 import signal
 import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional
 
 import pytz
 from hoymiles_modbus.client import HoymilesModbusTCP
@@ -144,6 +147,10 @@ class DtuQueryJob:
         Args:
             plant_data: PlantData object from DTU
         """
+        # Rows for the database, written in one transaction at the end
+        inverter_readings = []
+        port_readings = []
+        
         try:
             # plant_data is a PlantData object, not a dict
             inverters = plant_data.inverters if hasattr(plant_data, 'inverters') else []
@@ -155,80 +162,71 @@ class DtuQueryJob:
             has_alarms = False
             
             for inverter in inverters:
-                serial_number = inverter.serial_number
-                if not serial_number:
-                    continue
-                
-                # Build inverter data dict
-                inverter_data = {
-                    'grid_voltage': getattr(inverter, 'grid_voltage', None),
-                    'grid_frequency': getattr(inverter, 'grid_frequency', None),
-                    'temperature': getattr(inverter, 'temperature', None),
-                    'operating_status': getattr(inverter, 'operating_status', None),
-                    'alarm_code': getattr(inverter, 'alarm_code', None),
-                    'alarm_count': getattr(inverter, 'alarm_count', None),
-                    'link_status': getattr(inverter, 'link_status', None),
-                }
-                
-                # Save inverter data to database
-                self.persistence.save_inverter_data(
-                    serial_number=serial_number,
-                    dtu_name=self.dtu_config.name,
-                    data=inverter_data,
-                )
-                
-                # Write to InfluxDB
-                if self.influxdb:
-                    self.influxdb.write_inverter_data(
-                        serial_number=serial_number,
-                        dtu_name=self.dtu_config.name,
-                        data=inverter_data,
-                    )
-                
-                # Save port data
-                port_num = getattr(inverter, 'port_number', 1)
-                pv_power = getattr(inverter, 'pv_power', 0) or 0
-                today_prod = getattr(inverter, 'today_production', 0) or 0
-                total_prod = getattr(inverter, 'total_production', 0) or 0
-                
-                port_data = {
-                    'pv_voltage': getattr(inverter, 'pv_voltage', None),
-                    'pv_current': getattr(inverter, 'pv_current', None),
-                    'pv_power': pv_power,
-                    'today_production': today_prod,
-                    'total_production': total_prod,
-                }
-                
-                # Accumulate totals
-                total_pv_power += float(pv_power)
-                total_today_production += int(today_prod)
-                total_total_production += int(total_prod)
-                
-                if getattr(inverter, 'alarm_count', 0) > 0:
-                    has_alarms = True
-                
-                self.persistence.save_port_data(
-                    serial_number=serial_number,
-                    port_number=port_num,
-                    data=port_data,
-                )
+                try:
+                    serial_number = inverter.serial_number
+                    if not serial_number:
+                        continue
+                    
+                    # Build inverter data dict
+                    inverter_data = {
+                        'grid_voltage': getattr(inverter, 'grid_voltage', None),
+                        'grid_frequency': getattr(inverter, 'grid_frequency', None),
+                        'temperature': getattr(inverter, 'temperature', None),
+                        'operating_status': getattr(inverter, 'operating_status', None),
+                        'alarm_code': getattr(inverter, 'alarm_code', None),
+                        'alarm_count': getattr(inverter, 'alarm_count', None),
+                        'link_status': getattr(inverter, 'link_status', None),
+                    }
+                    
+                    # Build port data dict
+                    port_num = getattr(inverter, 'port_number', 1)
+                    pv_power = getattr(inverter, 'pv_power', 0) or 0
+                    today_prod = getattr(inverter, 'today_production', 0) or 0
+                    total_prod = getattr(inverter, 'total_production', 0) or 0
+                    
+                    port_data = {
+                        'pv_voltage': getattr(inverter, 'pv_voltage', None),
+                        'pv_current': getattr(inverter, 'pv_current', None),
+                        'pv_power': pv_power,
+                        'today_production': today_prod,
+                        'total_production': total_prod,
+                    }
+                    
+                    # Convert before recording anything, so a bad value skips the whole inverter
+                    pv_power_value = float(pv_power)
+                    today_prod_value = int(today_prod)
+                    total_prod_value = int(total_prod)
+                    alarm = getattr(inverter, 'alarm_count', 0) > 0
+                    
+                    inverter_readings.append((serial_number, inverter_data))
+                    port_readings.append((serial_number, port_num, port_data))
+                    
+                    # Accumulate totals
+                    total_pv_power += pv_power_value
+                    total_today_production += today_prod_value
+                    total_total_production += total_prod_value
+                    has_alarms = has_alarms or alarm
+                    
+                    # Write to InfluxDB
+                    if self.influxdb:
+                        self.influxdb.write_inverter_data(
+                            serial_number=serial_number,
+                            dtu_name=self.dtu_config.name,
+                            data=inverter_data,
+                        )
+                        self.influxdb.write_port_data(
+                            serial_number=serial_number,
+                            port_number=port_num,
+                            dtu_name=self.dtu_config.name,
+                            data=port_data,
+                        )
                 
-                # Write port data to InfluxDB
-                if self.influxdb:
-                    self.influxdb.write_port_data(
-                        serial_number=serial_number,
-                        port_number=port_num,
-                        dtu_name=self.dtu_config.name,
-                        data=port_data,
+                except Exception as e:
+                    # Skip this inverter but keep the readings of the others
+                    logger.error(
+                        f"Error processing inverter {getattr(inverter, 'serial_number', None)}: {e}",
+                        exc_info=True,
                     )
-                
-                # Update production cache
-                self.persistence.save_production_cache(
-                    serial_number=serial_number,
-                    port_number=port_num,
-                    today_production=today_prod,
-                    total_production=total_prod,
-                )
             
             # Write DTU-level data to InfluxDB
             if self.influxdb and inverters:
@@ -245,10 +243,13 @@ class DtuQueryJob:
                     data=dtu_data,
                 )
             
-            logger.debug(f"Saved data for {len(inverters)} inverters to database and InfluxDB")
+            logger.debug(f"Processed data for {len(inverters)} inverters")
             
         except Exception as e:
             logger.error(f"Error saving plant data: {e}", exc_info=True)
+        finally:
+            # Save whatever readings were collected, even if the loop failed part way
+            self.persistence.save_poll_data(self.dtu_config.name, inverter_readings, port_readings)
 
 
 class MultiDtuCoordinator:
@@ -282,8 +283,19 @@ class MultiDtuCoordinator:
         self.jobs: List[DtuQueryJob] = []
         self.last_reset_check = datetime.now()
         
+        # Latest WebSocket payload waiting to be pushed; a newer payload
+        # replaces one the sender has not picked up yet
+        self._ws_pending: Deque[Dict[str, Any]] = deque(maxlen=1)
+        self._ws_wake = threading.Event()
+        self._ws_sender: Optional[threading.Thread] = None
+        
         # Initialize jobs for each DTU
         self._initialize_jobs()
+        
+        # Worker threads are reused across query cycles, one per DTU
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, len(self.jobs)), thread_name_prefix='dtu'
+        )
     
     def _initialize_jobs(self) -> None:
         """Initialize query jobs for all DTUs."""
@@ -323,30 +335,41 @@ class MultiDtuCoordinator:
             Dictionary mapping DTU name to success status
         """
         results = {}
-        threads = []
         
         # Check for daily reset
         self._check_daily_reset()
         
-        # Execute jobs in parallel
-        for job in self.jobs:
-            thread = threading.Thread(
-                target=lambda j=job: results.update({j.dtu_config.name: j.execute()}),
-                daemon=True,
-            )
-            thread.start()
-            threads.append(thread)
+        # Execute jobs in parallel; a job still running from an earlier cycle
+        # returns False straight away through its own lock
+        futures = {job: self._executor.submit(job.execute) for job in self.jobs}
         
-        # Wait for all jobs to complete
-        for thread in threads:
-            thread.join(timeout=60)  # 60 second timeout per job
+        done, _ = wait(futures.values(), timeout=60)  # 60 second timeout for the cycle
+        
+        for job, future in futures.items():
+            if future not in done:
+                logger.warning(f"Query for {job.dtu_config.name} did not finish within 60s")
+                continue
+            try:
+                results[job.dtu_config.name] = future.result()
+            except Exception as e:
+                logger.error(f"Query job for {job.dtu_config.name} failed: {e}", exc_info=True)
         
-        # Send WebSocket update if enabled and at least one job succeeded
-        if self.websocket_client and any(results.values()):
+        # Send WebSocket update if anyone is listening and at least one job succeeded;
+        # building the payload queries the database, so skip it when nobody is connected
+        if (self.websocket_client and self.websocket_client.has_connections
+                and any(results.values())):
             self._send_websocket_update()
         
         return results
     
+    def close(self) -> None:
+        """Stop the DTU worker pool without waiting for running queries.
+        
+        Queued queries are cancelled. A query stuck on the network keeps its
+        worker until it times out.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
     def _send_websocket_update(self) -> None:
         """Send update to registered WebSockets."""
         try:
@@ -367,26 +390,43 @@ class MultiDtuCoordinator:
                 "inverters": inverters,
             }
             
-            # Send WebSocket update asynchronously
-            import asyncio
-            import threading
+            # Hand off to the sender thread so the poll loop does not wait on the network
+            self._ws_pending.append(payload)
+            self._ws_wake.set()
+            if self._ws_sender is None:
+                self._ws_sender = threading.Thread(
+                    target=self._websocket_sender_loop, name='websocket-sender', daemon=True
+                )
+                self._ws_sender.start()
             
-            def send_in_thread():
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
+        except Exception as e:
+            logger.error(f"Error preparing WebSocket update: {e}", exc_info=True)
+    
+    def _websocket_sender_loop(self) -> None:
+        """Push pending payloads to registered WebSockets.
+        
+        Runs on a single long-lived thread with its own event loop instead of
+        creating a thread and event loop for every update.
+        """
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        # websocket_client is fixed for the coordinator's lifetime, so bind
+        # the methods used on every wake once.
+        run = loop.run_until_complete
+        send_update = self.websocket_client.send_update
+        connections = self.websocket_client.connections
+        pending = self._ws_pending
+        wake = self._ws_wake
+        while True:
+            wake.wait()
+            wake.clear()
+            while pending:
+                payload = pending.popleft()
                 try:
-                    loop.run_until_complete(self.websocket_client.send_update(payload))
-                    logger.info(f"Successfully pushed data via WebSocket to {len(self.websocket_client.connections)} connections")
+                    run(send_update(payload))
+                    logger.info(f"Successfully pushed data via WebSocket to {len(connections)} connections")
                 except Exception as e:
                     logger.error(f"Error sending WebSocket update: {e}")
-                finally:
-                    loop.close()
-            
-            thread = threading.Thread(target=send_in_thread, daemon=True)
-            thread.start()
-            
-        except Exception as e:
-            logger.error(f"Error preparing WebSocket update: {e}", exc_info=True)
     
     def _check_daily_reset(self) -> None:
         """Check if daily production should be reset."""
@@ -422,27 +462,27 @@ def run_periodic_coordinator(
     """
     logger.info(f"Starting periodic queries every {query_period}s")
     
-    while not stop_event.is_set():
-        try:
-            # Execute all queries
-            results = coordinator.execute_all()
-            
-            # Log results
-            success_count = sum(1 for success in results.values() if success)
-            total_count = len(results)
-            
-            logger.info(
-                f"Query cycle complete: {success_count}/{total_count} successful"
-            )
+    try:
+        while not stop_event.is_set():
+            try:
+                # Execute all queries
+                results = coordinator.execute_all()
+                
+                # Log results
+                success_count = sum(1 for success in results.values() if success)
+                total_count = len(results)
+                
+                logger.info(
+                    f"Query cycle complete: {success_count}/{total_count} successful"
+                )
+                
+            except Exception as e:
+                logger.exception(f"Error in query cycle: {e}")
             
-        except Exception as e:
-            logger.exception(f"Error in query cycle: {e}")
-        
-        # Wait for next cycle (check stop event periodically)
-        for _ in range(query_period):
-            if stop_event.is_set():
-                break
-            time.sleep(1)
+            # Wait for next cycle; returns as soon as a signal sets the stop event
+            stop_event.wait(query_period)
+    finally:
+        coordinator.close()
     
     logger.info("Periodic query loop stopped")
 
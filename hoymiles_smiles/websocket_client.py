@@ -24,6 +24,13 @@ class WebSocketClient:
         self._lock = asyncio.Lock()
         self._tasks: List[asyncio.Task] = []
     
+    @property
+    def has_connections(self) -> bool:
+        """Whether any registered WebSocket is currently connected."""
+        return self.enabled and any(
+            connection["connected"] and connection["ws"] for connection in self.connections
+        )
+    
     async def register_websocket(self, ws_url: str, name: str = "Unknown") -> None:
         """Register a WebSocket endpoint and maintain connection.
         
@@ -173,29 +180,46 @@ class WebSocketClient:
     async def send_update(self, data: Dict[str, Any]) -> None:
         """Send data update to all connected WebSockets.
         
+        The message is serialized once and the same text is sent to every
+        connection.
+        
         Args:
             data: Data to send
         """
         if not self.enabled:
             return
         
-        # Send to all connected WebSockets
-        tasks = []
-        for connection in self.connections:
-            if connection["connected"] and connection["ws"]:
-                tasks.append(self._send_to_connection(connection, data))
+        connections = [
+            connection for connection in self.connections
+            if connection["connected"] and connection["ws"]
+        ]
+        if not connections:
+            return
+        
+        message = json.dumps({"type": "update", "data": data})
+        inverters = data.get("inverters", [])
+        inverter_count = len(inverters)
+        port_count = sum(len(inv.get("ports", [])) for inv in inverters)
         
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        # Send to all connected WebSockets
+        await asyncio.gather(
+            *(
+                self._send_to_connection(connection, message, inverter_count, port_count)
+                for connection in connections
+            ),
+            return_exceptions=True,
+        )
     
     async def _send_to_connection(
-        self, connection: Dict[str, Any], data: Dict[str, Any]
+        self, connection: Dict[str, Any], message: str, inverter_count: int, port_count: int
     ) -> None:
-        """Send data to a specific WebSocket connection.
+        """Send a serialized update to a specific WebSocket connection.
         
         Args:
             connection: Connection configuration
-            data: Data to send
+            message: JSON-encoded update message
+            inverter_count: Number of inverters in the update (for logging)
+            port_count: Number of ports in the update (for logging)
         """
         ws = connection["ws"]
         name = connection["name"]
@@ -204,20 +228,12 @@ class WebSocketClient:
             return
         
         try:
-            message = {
-                "type": "update",
-                "data": data,
-            }
-            
-            inverter_count = len(data.get("inverters", []))
-            port_count = sum(len(inv.get("ports", [])) for inv in data.get("inverters", []))
-            
             logger.info(
                 "[WebSocket] Sending update to %s: %d inverters, %d ports",
                 name, inverter_count, port_count
             )
             
-            await ws.send_json(message)
+            await ws.send_str(message)
             
             logger.info("[WebSocket] ✓ Successfully sent update to %s", name)
         
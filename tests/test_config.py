@@ -9,6 +9,7 @@ from hoymiles_smiles.config import (
     DatabaseConfig,
     DtuConfig,
     InfluxDBConfig,
+    LoggingConfig,
     ModbusConfig,
     TimingConfig,
 )
@@ -38,6 +39,13 @@ def test_dtu_config_invalid_port():
         DtuConfig(name="TestDTU", host="192.168.1.100", port=70000)
 
 
+def test_dtu_config_frozen():
+    """Test that sub-config objects cannot be modified after creation."""
+    config = DtuConfig(name="TestDTU", host="192.168.1.100")
+    with pytest.raises(ValidationError):
+        config.port = 503
+
+
 def test_modbus_config_valid():
     """Test valid Modbus configuration."""
     config = ModbusConfig(
@@ -89,6 +97,41 @@ def test_app_config_single_dtu():
     assert dtu_configs[0].host == "192.168.1.100"
 
 
+def test_app_config_sub_configs_cached():
+    """Test that sub-config objects are built once and rebuilt after assignment."""
+    config = AppConfig(dtu_host="192.168.1.100")
+    
+    timing = config.get_timing_config()
+    assert config.get_timing_config() is timing
+    
+    config.query_period = 30
+    assert config.get_timing_config() is not timing
+    assert config.get_timing_config().query_period == 30
+
+
+def test_app_config_copy_does_not_share_sub_configs():
+    """Test that model_copy(update=...) never serves the original's cached sub-configs."""
+    config = AppConfig(dtu_host="192.168.1.100", query_period=60)
+    timing = config.get_timing_config()
+    
+    copied = config.model_copy(update={"query_period": 30})
+    assert copied.get_timing_config().query_period == 30
+    assert config.get_timing_config() is timing
+    
+    # Assigning on a fresh copy leaves the original's cache alone
+    copied = config.model_copy()
+    copied.query_period = 45
+    assert copied.get_timing_config().query_period == 45
+    assert config.get_timing_config() is timing
+
+
+def test_app_config_exclude_inverters_set():
+    """Test that excluded inverter serials are exposed as a set."""
+    config = AppConfig(dtu_host="192.168.1.100", exclude_inverters=["SN1", "SN2", "SN1"])
+    
+    assert config.get_entity_filter_config().exclude_inverters == frozenset({"SN1", "SN2"})
+
+
 def test_app_config_missing_dtu():
     """Test app configuration without DTU."""
     with pytest.raises(ValidationError):
@@ -167,3 +210,10 @@ def test_database_config_mariadb_normalized():
     )
     assert config.type == "mysql"  # Should be normalized to mysql
 
+
+def test_logging_config_level():
+    """Test log level is case-insensitive and validated."""
+    assert LoggingConfig(level="info").level == "INFO"
+    
+    with pytest.raises(ValidationError):
+        LoggingConfig(level="verbose")
@@ -0,0 +1,122 @@
+"""Tests for health module."""
+
+import gzip
+import threading
+import urllib.request
+from unittest.mock import patch
+
+from prometheus_client import REGISTRY
+
+from hoymiles_smiles import health
+from hoymiles_smiles.health import INVERTER_POWER, QUERY_TOTAL, HealthMetrics
+
+
+def test_record_query_success():
+    """Test recording a successful query updates counters and status."""
+    metrics = HealthMetrics()
+    before = REGISTRY.get_sample_value(
+        'hoymiles_queries_total', {'dtu_name': 'TestDTU', 'status': 'success'}
+    ) or 0
+
+    metrics.record_query_success('TestDTU', 0.5)
+    metrics.record_query_success('TestDTU', 0.5)
+
+    assert metrics.query_count['TestDTU'] == 2
+    assert metrics.dtu_status['TestDTU'] == 'online'
+    assert REGISTRY.get_sample_value(
+        'hoymiles_queries_total', {'dtu_name': 'TestDTU', 'status': 'success'}
+    ) == before + 2
+
+
+def test_metric_children_cached():
+    """Test that label lookups are bound once per label combination."""
+    metrics = HealthMetrics()
+
+    child = metrics._labels(QUERY_TOTAL, 'TestDTU', 'error')
+    assert metrics._labels(QUERY_TOTAL, 'TestDTU', 'error') is child
+    assert child is QUERY_TOTAL.labels(dtu_name='TestDTU', status='error')
+
+    metrics.update_inverter_metrics('SN123', 1, 150.0, None, None)
+    assert REGISTRY.get_sample_value(
+        'hoymiles_inverter_power_watts', {'serial_number': 'SN123', 'port': '1'}
+    ) == 150.0
+    assert metrics._labels(INVERTER_POWER, 'SN123', 1) is INVERTER_POWER.labels(serial_number='SN123', port='1')
+
+
+def test_metrics_output_cached():
+    """Test that /metrics output is reused within the cache TTL."""
+    with patch.object(health, '_metrics_cache', (float('-inf'), b'', b'')):
+        with patch.object(health, 'generate_latest', return_value=b'metrics') as generate:
+            assert health._get_metrics_output() == b'metrics'
+            assert health._get_metrics_output() == b'metrics'
+            assert gzip.decompress(health._get_metrics_output(compressed=True)) == b'metrics'
+            generate.assert_called_once()
+
+
+def test_json_bytes_matches_stdlib():
+    """Test that JSON responses are the same with or without orjson."""
+    from datetime import datetime
+
+    data = {'time': datetime(2024, 1, 1, 12, 0), 'values': [1, 2.5, None], 1: 'one'}
+
+    encoded = health._json_bytes(data, default=str)
+    with patch.object(health, 'orjson', None):
+        assert health._json_bytes(data, default=str) == encoded
+
+
+def test_warm_binds_dtu_children():
+    """Test that warming exposes DTU series before the first query."""
+    metrics = HealthMetrics()
+    metrics.warm(['WarmDTU'])
+
+    assert (QUERY_TOTAL, ('WarmDTU', 'success')) in metrics._metric_children
+    assert REGISTRY.get_sample_value(
+        'hoymiles_queries_total', {'dtu_name': 'WarmDTU', 'status': 'error'}
+    ) == 0
+
+
+def test_health_status_snapshot_reused():
+    """Test that the per-DTU snapshot is rebuilt only after state changes."""
+    metrics = HealthMetrics()
+    metrics.record_query_success('TestDTU', 0.5)
+
+    with patch.object(metrics, '_build_snapshot', wraps=metrics._build_snapshot) as build:
+        first = metrics.get_health_status()
+        second = metrics.get_health_status()
+        assert build.call_count == 1
+        assert first['dtus'] == second['dtus']
+        assert first['dtus']['TestDTU']['seconds_since_last_success'] == 0
+
+        metrics.record_query_error('TestDTU', 'timeout', 'Timed out')
+        status = metrics.get_health_status()
+        assert build.call_count == 2
+        assert status['dtus']['TestDTU']['status'] == 'error'
+        assert status['dtus']['TestDTU']['error_count'] == 1
+
+
+def test_accepts_gzip():
+    """Test Accept-Encoding parsing for gzip /metrics responses."""
+    assert health._accepts_gzip('gzip')
+    assert health._accepts_gzip('deflate, GZIP;q=0.5')
+    assert health._accepts_gzip('*')
+    assert not health._accepts_gzip('')
+    assert not health._accepts_gzip('gzip;q=0')
+    assert not health._accepts_gzip('gzip; q=0.0, identity')
+    assert not health._accepts_gzip('x-gzip-foo')
+
+
+def test_metrics_response_headers():
+    """Test that /metrics honours Accept-Encoding and always sends Vary."""
+    server = health.BoundedThreadingHTTPServer(('127.0.0.1', 0), health.HealthCheckHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f'http://127.0.0.1:{server.server_address[1]}/metrics'
+    try:
+        for accept_encoding, expected_encoding in (('gzip', 'gzip'), ('gzip;q=0', None)):
+            request = urllib.request.Request(url, headers={'Accept-Encoding': accept_encoding})
+            with urllib.request.urlopen(request) as response:
+                assert response.headers['Vary'] == 'Accept-Encoding'
+                assert response.headers.get('Content-Encoding') == expected_encoding
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -1,9 +1,11 @@
 #!/usr/bin/env python
 """Tests for __main__ module."""
 
+import subprocess
+import sys
 from unittest.mock import MagicMock, patch
 
-from hoymiles_smiles.__main__ import parse_args
+from hoymiles_smiles.__main__ import _build_parser, parse_args
 
 
 def test_parse_args_minimal():
@@ -27,3 +29,68 @@ def test_parse_args_with_database():
         assert args.dtu_host == '192.168.1.100'
         assert args.db_host == 'localhost'
         assert args.db_name == 'testdb'
+
+
+def test_parse_args_config_file_reparsed_on_change(tmp_path):
+    """Test that an edited config file is parsed again and nothing is cached on disk."""
+    config_file = tmp_path / 'config.yaml'
+    config_file.write_text('dtu-host: 192.168.1.50\nquery-period: 30\n')
+
+    with patch('sys.argv', ['hoymiles_smiles', '-c', str(config_file)]):
+        args = parse_args()
+    assert args.dtu_host == '192.168.1.50'
+    assert args.query_period == 30
+    assert [p.name for p in tmp_path.iterdir()] == ['config.yaml']
+
+    # Modifying the config file invalidates the parse_args() memo
+    config_file.write_text('dtu-host: 192.168.1.51\nquery-period: 120\n')
+    with patch('sys.argv', ['hoymiles_smiles', '-c', str(config_file)]):
+        args = parse_args()
+    assert args.dtu_host == '192.168.1.51'
+    assert args.query_period == 120
+
+
+def test_parse_args_without_config_skips_yaml():
+    """Test that PyYAML is only imported when a config file is given."""
+    code = (
+        "import sys; sys.argv = ['hoymiles_smiles', '--dtu-host', '192.168.1.100']; "
+        "from hoymiles_smiles.__main__ import parse_args; parse_args(); "
+        "print('yaml' in sys.modules)"
+    )
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == 'False'
+
+
+def test_import_skips_pydantic():
+    """Test that importing the entry point does not load the config models."""
+    code = "import sys, hoymiles_smiles.__main__; print('pydantic' in sys.modules)"
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == 'False'
+
+
+def test_parse_args_memoized():
+    """Test that repeated parsing with the same inputs reuses the result."""
+    argv = ['hoymiles_smiles', '--dtu-host', '192.168.1.100']
+    with patch('sys.argv', argv):
+        first = parse_args()
+        with patch('hoymiles_smiles.__main__._build_parser') as build_parser:
+            second = parse_args()
+            build_parser.assert_not_called()
+
+    assert vars(first) == vars(second)
+    assert first is not second
+
+
+def test_parse_args_env_vars():
+    """Test that relevant environment variables are read and change the result."""
+    argv = ['hoymiles_smiles', '--dtu-host', '192.168.1.100']
+    with patch('sys.argv', argv):
+        with patch.dict('os.environ', {'QUERY_PERIOD': '15'}):
+            assert parse_args().query_period == 15
+        with patch.dict('os.environ', {'QUERY_PERIOD': '45'}):
+            assert parse_args().query_period == 45
+
+
+def test_build_parser_reused():
+    """Test that the argument schema is built once per process."""
+    assert _build_parser() is _build_parser()
@@ -103,3 +103,91 @@ def test_disabled_persistence_operations():
     
     pm.close()  # Should not fail
 
+
+def test_execute_script_batches_postgres():
+    """Test that PostgreSQL schema statements are sent in one execute."""
+    from hoymiles_smiles.db_adapter import DatabaseAdapter
+    
+    cursor = MagicMock()
+    DatabaseAdapter('postgres').execute_script(cursor, ['CREATE TABLE a ()', 'CREATE TABLE b ()'])
+    cursor.execute.assert_called_once_with('CREATE TABLE a ();\nCREATE TABLE b ()')
+
+
+def test_execute_script_per_statement_mysql():
+    """Test that MySQL schema statements are executed one by one."""
+    from hoymiles_smiles.db_adapter import DatabaseAdapter
+    
+    cursor = MagicMock()
+    DatabaseAdapter('mysql').execute_script(cursor, ['CREATE TABLE a ()', 'CREATE TABLE b ()'])
+    assert cursor.execute.call_count == 2
+
+
+def test_create_pool_sets_synchronous_commit_postgres():
+    """Test that the PostgreSQL pool passes synchronous_commit as a session option."""
+    from hoymiles_smiles import db_adapter
+    
+    if not db_adapter.HAS_POSTGRES:
+        pytest.skip("psycopg2 not installed")
+    
+    with patch.object(db_adapter.pg_pool, 'ThreadedConnectionPool') as mock_pool:
+        db_adapter.DatabaseAdapter('postgres').create_pool(
+            {'host': 'localhost'}, 10, 20, synchronous_commit='off'
+        )
+    
+    mock_pool.assert_called_once_with(
+        minconn=1, maxconn=30, host='localhost', options='-c synchronous_commit=off'
+    )
+
+
+def test_save_poll_data_single_transaction():
+    """Test that one poll's readings are written with one commit."""
+    from hoymiles_smiles.db_adapter import DatabaseAdapter
+    
+    pm = PersistenceManager(enabled=False)
+    pm.enabled = True
+    pm.adapter = DatabaseAdapter('postgres')
+    pm.connection_pool = MagicMock()
+    mock_conn = pm.connection_pool.getconn.return_value
+    mock_cursor = mock_conn.cursor.return_value
+    
+    pm.save_poll_data(
+        'DTU1',
+        [('SN1', {'temperature': 30.0}), ('SN2', {'temperature': 31.0})],
+        [('SN1', 1, {'pv_power': 100, 'today_production': 5, 'total_production': 50}),
+         ('SN1', 2, {'pv_power': 200, 'today_production': 6, 'total_production': 60})],
+    )
+    
+    assert mock_cursor.executemany.call_count == 4
+    upsert_rows = mock_cursor.executemany.call_args_list[0].args[1]
+    assert upsert_rows == [('SN1', 'DTU1'), ('SN2', 'DTU1')]
+    cache_rows = mock_cursor.executemany.call_args_list[3].args[1]
+    assert cache_rows == [('SN1', 1, 5, 50), ('SN1', 2, 6, 60)]
+    mock_conn.commit.assert_called_once()
+    pm.connection_pool.putconn.assert_called_once_with(mock_conn)
+
+
+def test_save_poll_data_falls_back_to_rows():
+    """Test that a failed batch is retried row by row."""
+    from hoymiles_smiles.db_adapter import DatabaseAdapter
+    
+    pm = PersistenceManager(enabled=False)
+    pm.enabled = True
+    pm.adapter = DatabaseAdapter('postgres')
+    pm.connection_pool = MagicMock()
+    mock_conn = pm.connection_pool.getconn.return_value
+    mock_conn.cursor.return_value.executemany.side_effect = Exception("bad row")
+    
+    with patch.object(pm, 'save_inverter_data') as save_inverter, \
+            patch.object(pm, 'save_port_data') as save_port, \
+            patch.object(pm, 'save_production_cache') as save_cache:
+        pm.save_poll_data(
+            'DTU1',
+            [('SN1', {'temperature': 30.0})],
+            [('SN1', 1, {'pv_power': 100, 'today_production': 5, 'total_production': 50})],
+        )
+    
+    mock_conn.rollback.assert_called_once()
+    pm.connection_pool.putconn.assert_called_once_with(mock_conn)
+    save_inverter.assert_called_once_with('SN1', 'DTU1', {'temperature': 30.0})
+    save_port.assert_called_once()
+    save_cache.assert_called_once_with('SN1', 1, 5, 50)
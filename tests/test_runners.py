@@ -0,0 +1,105 @@
+"""Tests for runners module."""
+
+import threading
+import time
+from concurrent.futures import wait
+from unittest.mock import MagicMock, patch
+
+from hoymiles_smiles.runners import DtuQueryJob, MultiDtuCoordinator
+
+
+def _make_job(name, query):
+    """Create a query job for a DTU whose query runs the given function."""
+    dtu_config = MagicMock()
+    dtu_config.name = name
+    error_recovery = MagicMock()
+    error_recovery.execute_with_recovery.side_effect = lambda breaker, fn: query()
+    return DtuQueryJob(
+        dtu_config=dtu_config,
+        modbus_client=MagicMock(),
+        health_metrics=MagicMock(),
+        error_recovery=error_recovery,
+        persistence_manager=MagicMock(),
+        influxdb_writer=None,
+        config=MagicMock(),
+    )
+
+
+def _make_coordinator(jobs):
+    """Create a coordinator running the given jobs."""
+    def initialize_jobs(self):
+        self.jobs.extend(jobs)
+
+    config = MagicMock(timezone='UTC', reset_hour=0)
+    with patch.object(MultiDtuCoordinator, '_initialize_jobs', initialize_jobs):
+        return MultiDtuCoordinator(config, MagicMock(), MagicMock(), MagicMock())
+
+
+def _wait_briefly(futures, timeout):
+    """Wait for futures with a short timeout instead of the cycle's 60s."""
+    return wait(futures, timeout=0.5)
+
+
+def test_execute_all_overlapping_query_returns_false():
+    """Test that a job still running from the previous cycle is not run twice."""
+    release = threading.Event()
+    hung_query = MagicMock(side_effect=lambda: release.wait(5) and MagicMock(inverters=[]))
+    coordinator = _make_coordinator([
+        _make_job('ok', lambda: MagicMock(inverters=[])),
+        _make_job('hung', hung_query),
+    ])
+
+    with patch('hoymiles_smiles.runners.wait', side_effect=_wait_briefly):
+        assert coordinator.execute_all() == {'ok': True}
+        assert coordinator.execute_all() == {'ok': True, 'hung': False}
+
+    assert hung_query.call_count == 1
+    release.set()
+    coordinator.close()
+
+
+def test_execute_all_contains_job_exception():
+    """Test that an exception escaping a job does not escape execute_all."""
+    job = _make_job('broken', lambda: None)
+    coordinator = _make_coordinator([job, _make_job('ok', lambda: MagicMock(inverters=[]))])
+
+    with patch.object(job, 'execute', side_effect=RuntimeError('boom')):
+        assert coordinator.execute_all() == {'ok': True}
+
+    coordinator.close()
+
+
+def test_close_does_not_wait_for_running_query():
+    """Test that closing the coordinator does not block on a hung query."""
+    release = threading.Event()
+    coordinator = _make_coordinator([_make_job('hung', lambda: release.wait(5))])
+
+    with patch('hoymiles_smiles.runners.wait', side_effect=_wait_briefly):
+        coordinator.execute_all()
+
+    start = time.monotonic()
+    coordinator.close()
+    assert time.monotonic() - start < 1
+    release.set()
+
+
+def test_save_plant_data_skips_bad_inverter():
+    """Test that one bad inverter does not drop the readings of the others."""
+    persistence = MagicMock()
+    job = DtuQueryJob.__new__(DtuQueryJob)
+    job.dtu_config = MagicMock()
+    job.dtu_config.name = 'DTU1'
+    job.persistence = persistence
+    job.influxdb = None
+
+    good = MagicMock(serial_number='SN1', port_number=1, pv_power=100, today_production=5,
+                     total_production=50, alarm_count=0)
+    bad = MagicMock(serial_number='SN2', port_number=1, pv_power='n/a', today_production=0,
+                    total_production=0, alarm_count=0)
+
+    job._save_plant_data(MagicMock(inverters=[bad, good]))
+
+    dtu_name, inverter_readings, port_readings = persistence.save_poll_data.call_args.args
+    assert dtu_name == 'DTU1'
+    assert [serial for serial, _ in inverter_readings] == ['SN1']
+    assert [(serial, port) for serial, port, _ in port_readings] == [('SN1', 1)]